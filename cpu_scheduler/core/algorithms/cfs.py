@@ -0,0 +1,123 @@
+import heapq
+from typing import List, Tuple
+from models.process import Process, ProcessState
+from core.timeline import Timeline
+
+# Peso de un proceso con nice 0 (referencia para el avance del vruntime)
+NICE_0_WEIGHT = 1024
+
+# Tabla de pesos de Linux (sched_prio_to_weight) para nice -20..19:
+# cada nivel de nice equivale a ~10% más o menos de CPU que el vecino.
+NICE_TO_WEIGHT = [
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+]
+
+
+def nice_to_weight(nice: int) -> int:
+    """Convierte un valor nice (se recorta a -20..19) en su peso de CFS."""
+    return NICE_TO_WEIGHT[min(max(nice, -20), 19) + 20]
+
+
+class CFS:
+    """
+    Algoritmo de planificación estilo CFS (Completely Fair Scheduler de Linux).
+    - La prioridad del proceso se interpreta como valor nice (menor = más CPU) y se mapea a un peso.
+    - Cada proceso acumula vruntime = tiempo ejecutado * NICE_0_WEIGHT / peso;
+      siempre se ejecuta el de menor vruntime (runqueue ordenada en un heap).
+    - La porción de CPU de cada turno es target_latency * peso / peso_total,
+      nunca menor a min_granularity; con muchos procesos el período se estira a n * min_granularity.
+    - Dirigido por eventos: avanza de porción en porción, no de a una unidad de tiempo.
+    - Los procesos que llegan entran con el vruntime mínimo actual (no acaparan la CPU)
+      y se consideran en la siguiente decisión, sin interrumpir la porción en curso.
+    """
+    name = "CFS"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
+
+    def __init__(self, target_latency: int = 12, min_granularity: int = 2):
+        """
+        Inicializa el planificador.
+        - target_latency: período en el que todos los procesos listos deberían ejecutar una vez.
+        - min_granularity: porción mínima de CPU por turno (mayor a 0).
+        """
+        if min_granularity <= 0 or target_latency < min_granularity:
+            raise ValueError("Se requiere 0 < min_granularity <= target_latency.")
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+
+    def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
+        """
+        Ejecuta el algoritmo CFS sobre una lista de procesos.
+        - Devuelve:
+            • Un objeto Timeline con el diagrama de Gantt.
+            • La lista de procesos con métricas calculadas (inicio, finalización, etc.).
+        """
+        # Orden inicial de procesos por tiempo de llegada y luego por ID
+        procs = sorted(processes, key=lambda p: (p.arrival_time, p.id))
+        n = len(procs)
+        weights = [nice_to_weight(p.priority) for p in procs]
+        # Con más de este número de procesos, el período se estira para respetar min_granularity
+        nr_latency = self.target_latency // self.min_granularity
+        timeline = Timeline()
+        track = self.track_state  # Registrar estados por despacho (opcional)
+        runqueue: list = []   # Heap de (vruntime, orden de llegada)
+        total_weight = 0      # Suma de pesos de los procesos listos
+        min_vruntime = 0.0
+        t = 0
+        idx = 0
+        finished = 0
+
+        while finished < n:
+            # Ingresar procesos que llegaron hasta el tiempo actual
+            while idx < n and procs[idx].arrival_time <= t:
+                heapq.heappush(runqueue, (min_vruntime, idx))
+                total_weight += weights[idx]
+                if track:
+                    procs[idx].state = ProcessState.LISTO
+                idx += 1
+
+            if not runqueue:
+                # CPU idle hasta el próximo arribo
+                timeline.add_slot(None, t, procs[idx].arrival_time)
+                t = procs[idx].arrival_time
+                continue
+
+            # Elegir el proceso con menor vruntime y calcular su porción de CPU
+            vruntime, i = heapq.heappop(runqueue)
+            p = procs[i]
+            nr_running = len(runqueue) + 1
+            period = self.target_latency if nr_running <= nr_latency else nr_running * self.min_granularity
+            time_slice = max(self.min_granularity, round(period * weights[i] / total_weight))
+            run_time = min(time_slice, p.remaining_time)
+
+            if p.start_time is None:
+                p.start_time = t
+            if track:
+                p.state = ProcessState.EJECUTANDO
+            timeline.add_slot(p.id, t, t + run_time)
+            t += run_time
+            p.remaining_time -= run_time
+            vruntime += run_time * NICE_0_WEIGHT / weights[i]
+
+            if p.remaining_time == 0:
+                if track:
+                    p.state = ProcessState.TERMINADO
+                p.completion_time = t
+                total_weight -= weights[i]
+                finished += 1
+            else:
+                if track:
+                    p.state = ProcessState.LISTO
+                heapq.heappush(runqueue, (vruntime, i))
+
+            # El vruntime mínimo solo avanza (referencia para los que llegan)
+            if runqueue:
+                min_vruntime = max(min_vruntime, runqueue[0][0])
+
+        return timeline, procs
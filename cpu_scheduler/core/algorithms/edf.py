@@ -0,0 +1,57 @@
+import math
+from typing import List, Optional, Tuple
+from models.process import Process
+from core.timeline import Timeline
+from core.realtime import (
+    MAX_JOBS,
+    UnschedulableWorkloadError,
+    check_schedulability,
+    expand_periodic,
+    run_preemptive_by_key,
+)
+
+class EDF:
+    """
+    Algoritmo de planificación EDF (Earliest Deadline First).
+    - Apropiativo: siempre ejecuta el trabajo listo con el plazo absoluto más cercano.
+    - Las tareas periódicas (con `period`) se expanden en trabajos hasta el horizonte.
+    - Los procesos sin plazo se consideran con plazo infinito (se atienden al final).
+    - Con `precheck=True`, rechaza antes de simular cargas periódicas con utilización > 1.
+    """
+    name = "EDF (Earliest Deadline First)"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
+
+    def __init__(self, horizon: Optional[int] = None, precheck: bool = True,
+                 max_jobs: int = MAX_JOBS):
+        """
+        Inicializa el planificador.
+        - horizon: instante hasta el que se liberan trabajos periódicos (default: hiperperíodo).
+        - precheck: si es True, aplica el pre-chequeo de planificabilidad.
+        - max_jobs: máximo de trabajos periódicos a generar al expandir las tareas
+          (si el horizonte implica más, `run` lanza ValueError).
+        """
+        if max_jobs <= 0:
+            raise ValueError("max_jobs debe ser mayor a 0.")
+        self.horizon = horizon
+        self.precheck = precheck
+        self.max_jobs = max_jobs
+
+    def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
+        """
+        Ejecuta EDF sobre una lista de procesos (o tareas periódicas).
+        - Devuelve:
+            • Un objeto Timeline con el diagrama de Gantt.
+            • La lista de trabajos con métricas calculadas (inicio, finalización, etc.).
+        - Lanza UnschedulableWorkloadError si el pre-chequeo demuestra que es imposible.
+        """
+        if self.precheck:
+            report = check_schedulability(processes, "edf")
+            if report.schedulable is False:
+                raise UnschedulableWorkloadError(
+                    f"Carga no planificable con EDF: utilización {report.utilization:.2f} > 1.")
+
+        jobs = expand_periodic(processes, self.horizon, self.max_jobs)
+        # Clave: plazo absoluto (infinito si el trabajo no tiene plazo)
+        return run_preemptive_by_key(
+            jobs, lambda p: p.absolute_deadline if p.deadline is not None else math.inf,
+            self.track_state)
@@ -1,5 +1,5 @@
 from typing import List, Tuple
-from models.process import Process
+from models.process import Process, ProcessState
 from core.timeline import Timeline
 
 class FCFS:
@@ -9,6 +9,7 @@ class FCFS:
     - No es apropiativo: una vez que un proceso comienza, se ejecuta hasta terminar.
     """
     name = "FCFS"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
 
     def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
         """
@@ -21,6 +22,7 @@ class FCFS:
         procs = sorted(processes, key=lambda p: (p.arrival_time, p.id))
         t = 0  # Tiempo actual de la simulación
         timeline = Timeline()  # Acumula los segmentos de ejecución
+        track = self.track_state  # Registrar estados por despacho (opcional)
 
         # Iterar sobre cada proceso en orden de llegada
         for p in procs:
@@ -30,7 +32,8 @@ class FCFS:
                 t = p.arrival_time
 
             # Inicia ejecución del proceso
-            p.state = "Ejecutando"
+            if track:
+                p.state = ProcessState.EJECUTANDO
             if p.start_time is None:
                 p.start_time = t  # Registrar primera ejecución
 
@@ -38,7 +41,8 @@ class FCFS:
             t += p.burst_time  # Ejecutar el proceso completo (no apropiativo)
             p.remaining_time = 0
             p.completion_time = t
-            p.state = "Terminado"
+            if track:
+                p.state = ProcessState.TERMINADO
 
             # Registrar ejecución en el diagrama de Gantt
             timeline.add_slot(p.id, start, t)
@@ -0,0 +1,99 @@
+import random
+from typing import Dict, List, Optional, Tuple
+from models.process import Process, ProcessState
+from core.timeline import Timeline
+from core.proportional import FenwickTree, default_tickets
+
+class LotteryScheduler:
+    """
+    Algoritmo de planificación por lotería (proporcional).
+    - Cada proceso tiene tickets; en cada quantum se sortea un ticket entre los procesos listos
+      y se ejecuta a su dueño, de modo que la CPU se reparte en proporción a los tickets.
+    - El sorteo usa un árbol de Fenwick: O(log n) por decisión.
+    - Con `seed` fijo la simulación es reproducible.
+    """
+    name = "Lotería"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
+
+    def __init__(self, quantum: int = 1, seed: Optional[int] = None,
+                 tickets: Optional[Dict[str, int]] = None):
+        """
+        Inicializa el planificador.
+        - quantum: unidades de tiempo por sorteo (mayor a 0).
+        - seed: semilla del generador aleatorio (None => no reproducible).
+        - tickets: tickets por ID de proceso; los que falten se derivan de la prioridad.
+        """
+        if quantum <= 0:
+            raise ValueError("El quantum debe ser mayor a 0.")
+        self.quantum = quantum
+        self.seed = seed
+        self.tickets = tickets or {}
+
+    @property
+    def reproducible(self) -> bool:
+        """Sin semilla cada ejecución sortea distinto, así que el resultado no puede reutilizarse."""
+        return self.seed is not None
+
+    def tickets_for(self, p: Process) -> int:
+        """Devuelve los tickets asignados a un proceso."""
+        tickets = self.tickets.get(p.id)
+        return default_tickets(p.priority) if tickets is None else tickets
+
+    def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
+        """
+        Ejecuta el algoritmo de lotería sobre una lista de procesos.
+        - Devuelve:
+            • Un objeto Timeline con el diagrama de Gantt.
+            • La lista de procesos con métricas calculadas (inicio, finalización, etc.).
+        """
+        # Orden inicial de procesos por tiempo de llegada y luego por ID
+        procs = sorted(processes, key=lambda p: (p.arrival_time, p.id))
+        n = len(procs)
+        tickets = [self.tickets_for(p) for p in procs]
+        if any(tk <= 0 for tk in tickets):
+            raise ValueError("Cada proceso debe tener al menos 1 ticket.")
+        rng = random.Random(self.seed)
+        pool = FenwickTree(n)  # Tickets de los procesos listos, indexados por orden de llegada
+        timeline = Timeline()
+        track = self.track_state  # Registrar estados por despacho (opcional)
+        t = 0
+        idx = 0
+        finished = 0
+
+        while finished < n:
+            # Ingresar procesos que llegaron hasta el tiempo actual
+            while idx < n and procs[idx].arrival_time <= t:
+                pool.add(idx, tickets[idx])
+                if track:
+                    procs[idx].state = ProcessState.LISTO
+                idx += 1
+
+            if pool.total == 0:
+                # CPU idle hasta el próximo arribo
+                timeline.add_slot(None, t, procs[idx].arrival_time)
+                t = procs[idx].arrival_time
+                continue
+
+            # Sorteo del ticket ganador
+            i = pool.find(rng.randrange(pool.total))
+            p = procs[i]
+            run_time = min(self.quantum, p.remaining_time)
+            if p.start_time is None:
+                p.start_time = t
+            if track:
+                p.state = ProcessState.EJECUTANDO
+            timeline.add_slot(p.id, t, t + run_time)
+            t += run_time
+            p.remaining_time -= run_time
+
+            if p.remaining_time == 0:
+                if track:
+                    p.state = ProcessState.TERMINADO
+                p.completion_time = t
+                pool.add(i, -tickets[i])  # Sus tickets salen del sorteo
+                finished += 1
+            else:
+                if track:
+                    p.state = ProcessState.LISTO
+
+        return timeline, procs
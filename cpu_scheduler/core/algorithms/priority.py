@@ -1,6 +1,7 @@
-from typing import List, Tuple
-from models.process import Process
+from typing import List, Optional, Tuple
+from models.process import Process, ProcessState
 from core.timeline import Timeline
+from core.profiling import SchedulerProfile
 
 class PriorityScheduler:
     """
@@ -11,6 +12,7 @@ class PriorityScheduler:
         • No preemptivo: una vez que un proceso comienza, se ejecuta hasta terminar.
     """
     name = "Prioridades"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
 
     def __init__(self, preemptive: bool = True):
         """
@@ -19,6 +21,7 @@ class PriorityScheduler:
         - preemptive=False: versión no apropiativa.
         """
         self.preemptive = preemptive
+        self.profiler: Optional[SchedulerProfile] = None  # Instrumentación opcional
 
     def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
         """
@@ -32,14 +35,23 @@ class PriorityScheduler:
         procs = sorted(processes, key=lambda p: (p.arrival_time, p.id))
         t = 0  # Tiempo actual de la simulación
         timeline = Timeline()  # Acumula los segmentos de ejecución
+        track = self.track_state  # Registrar estados por despacho (opcional)
         n = len(procs)  # Número total de procesos
         finished = 0  # Contador de procesos completados
         current = None  # Proceso en ejecución (solo relevante en modo no preemptivo)
 
+        prof = self.profiler  # None => instrumentación desactivada
+        last = None  # Proceso que ejecutó en el segmento anterior
+
         # Bucle principal: se ejecuta hasta que todos los procesos terminen
         while finished < n:
+            if prof is not None:
+                t0 = prof.clock()
             # Lista de procesos listos en el tiempo actual
             ready = [p for p in procs if p.arrival_time <= t and p.remaining_time > 0]
+            if prof is not None:
+                t1 = prof.clock()
+                prof.add_time("admission", t1 - t0)
 
             if not ready:
                 # Si no hay procesos listos, avanzar al próximo arribo
@@ -47,6 +59,10 @@ class PriorityScheduler:
                 timeline.add_slot(None, t, next_arrival)  # CPU idle hasta próximo arribo
                 t = next_arrival
                 current = None
+                last = None
+                if prof is not None:
+                    prof.slot_appends += 1
+                    prof.add_time("timeline", prof.clock() - t1)
                 continue
 
             # Selección por prioridad (menor número => mayor prioridad).
@@ -60,10 +76,20 @@ class PriorityScheduler:
                 # Preemptivo o inicio de nuevo proceso
                 chosen = highest
 
+            if prof is not None:
+                prof.dispatches += 1
+                prof.sample_ready(len(ready))
+                # Desalojo: el proceso anterior sigue pendiente pero se elige otro
+                if last is not None and last is not chosen and last.remaining_time > 0:
+                    prof.preemptions += 1
+                t2 = prof.clock()
+                prof.add_time("selection", t2 - t1)
+
             # Registrar tiempo de inicio si es la primera vez que ejecuta
             if chosen.start_time is None:
                 chosen.start_time = t
-            chosen.state = "Ejecutando"
+            if track:
+                chosen.state = ProcessState.EJECUTANDO
 
             if self.preemptive:
                 # Modo preemptivo: ejecutar solo 1 unidad de tiempo y luego reevaluar
@@ -77,17 +103,26 @@ class PriorityScheduler:
                 t += chosen.remaining_time
                 chosen.remaining_time = 0
                 timeline.add_slot(chosen.id, start, t)
+            if prof is not None:
+                prof.slot_appends += 1
+                prof.add_time("timeline", prof.clock() - t2)
+            last = chosen
 
             # Verificar si el proceso terminó
             if chosen.remaining_time == 0:
-                chosen.state = "Terminado"
+                if track:
+                    chosen.state = ProcessState.TERMINADO
                 chosen.completion_time = t
                 finished += 1
                 current = None
             else:
                 # Si aún queda tiempo, vuelve a estado "Listo"
-                chosen.state = "Listo"
+                if track:
+                    chosen.state = ProcessState.LISTO
                 current = chosen if not self.preemptive else None
 
+        if prof is not None:
+            prof.slots_emitted += len(timeline.slots)
+
         # Devolver timeline y lista completa de procesos con métricas
         return timeline, procs
@@ -0,0 +1,57 @@
+import math
+from typing import List, Optional, Tuple
+from models.process import Process
+from core.timeline import Timeline
+from core.realtime import (
+    MAX_JOBS,
+    UnschedulableWorkloadError,
+    check_schedulability,
+    expand_periodic,
+    run_preemptive_by_key,
+)
+
+class RateMonotonic:
+    """
+    Algoritmo de planificación Rate Monotonic (RM).
+    - Apropiativo con prioridades estáticas: menor período => mayor prioridad.
+    - Los procesos sin período usan su plazo relativo como período (deadline monotonic);
+      si tampoco tienen plazo, reciben la menor prioridad.
+    - Con `precheck=True`, rechaza antes de simular cargas periódicas con utilización > 1.
+    """
+    name = "Rate Monotonic"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
+
+    def __init__(self, horizon: Optional[int] = None, precheck: bool = True,
+                 max_jobs: int = MAX_JOBS):
+        """
+        Inicializa el planificador.
+        - horizon: instante hasta el que se liberan trabajos periódicos (default: hiperperíodo).
+        - precheck: si es True, aplica el pre-chequeo de planificabilidad.
+        - max_jobs: máximo de trabajos periódicos a generar al expandir las tareas
+          (si el horizonte implica más, `run` lanza ValueError).
+        """
+        if max_jobs <= 0:
+            raise ValueError("max_jobs debe ser mayor a 0.")
+        self.horizon = horizon
+        self.precheck = precheck
+        self.max_jobs = max_jobs
+
+    def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
+        """
+        Ejecuta Rate Monotonic sobre una lista de procesos (o tareas periódicas).
+        - Devuelve:
+            • Un objeto Timeline con el diagrama de Gantt.
+            • La lista de trabajos con métricas calculadas (inicio, finalización, etc.).
+        - Lanza UnschedulableWorkloadError si el pre-chequeo demuestra que es imposible.
+        """
+        if self.precheck:
+            report = check_schedulability(processes, "rm")
+            if report.schedulable is False:
+                raise UnschedulableWorkloadError(
+                    f"Carga no planificable con RM: utilización {report.utilization:.2f} > 1.")
+
+        jobs = expand_periodic(processes, self.horizon, self.max_jobs)
+        # Clave: período (o plazo relativo como respaldo); sin ninguno => prioridad mínima
+        return run_preemptive_by_key(
+            jobs, lambda p: p.period or (p.deadline if p.deadline is not None else math.inf),
+            self.track_state)
@@ -1,7 +1,8 @@
 from typing import List, Tuple, Optional
 from collections import deque
-from models.process import Process
+from models.process import Process, ProcessState
 from core.timeline import Timeline
+from core.profiling import SchedulerProfile
 
 class RoundRobin:
     """
@@ -11,6 +12,7 @@ class RoundRobin:
     - Si un proceso no termina en su quantum, vuelve al final de la cola.
     """
     name = "Round Robin"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
 
     def __init__(self, quantum: int = 4):
         """
@@ -20,6 +22,7 @@ class RoundRobin:
         if quantum <= 0:
             raise ValueError("El quantum debe ser mayor a 0.")
         self.quantum = quantum
+        self.profiler: Optional[SchedulerProfile] = None  # Instrumentación opcional
 
     def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
         """
@@ -32,18 +35,27 @@ class RoundRobin:
         procs = sorted(processes, key=lambda p: (p.arrival_time, p.id))
         t = 0  # Tiempo actual de la simulación
         timeline = Timeline()  # Acumula los segmentos de ejecución
+        track = self.track_state  # Registrar estados por despacho (opcional)
         queue = deque()  # Cola circular de procesos listos
         idx = 0  # Índice para recorrer procesos ordenados por llegada
         finished = 0  # Contador de procesos completados
         n = len(procs)  # Número total de procesos
 
+        prof = self.profiler  # None => instrumentación desactivada
+
         # Bucle principal: se ejecuta hasta que todos los procesos terminen
         while finished < n:
+            if prof is not None:
+                t0 = prof.clock()
             # Ingresar procesos que llegan en el tiempo actual
             while idx < n and procs[idx].arrival_time <= t:
                 queue.append(procs[idx])
-                procs[idx].state = "Listo"
+                if track:
+                    procs[idx].state = ProcessState.LISTO
                 idx += 1
+            if prof is not None:
+                t1 = prof.clock()
+                prof.add_time("admission", t1 - t0)
 
             if not queue:
                 # Si no hay procesos listos, avanzar al próximo arribo
@@ -51,36 +63,60 @@ class RoundRobin:
                     next_arrival = procs[idx].arrival_time
                     timeline.add_slot(None, t, next_arrival)  # CPU idle hasta próximo arribo
                     t = next_arrival
+                    if prof is not None:
+                        prof.slot_appends += 1
+                        prof.add_time("timeline", prof.clock() - t1)
                     continue
                 else:
                     break  # No quedan procesos pendientes
 
             # Seleccionar el primer proceso de la cola
+            if prof is not None:
+                prof.dispatches += 1
+                prof.sample_ready(len(queue))
             p = queue.popleft()
             run_time = min(self.quantum, p.remaining_time)  # Ejecutar hasta quantum o hasta terminar
+            if prof is not None:
+                t2 = prof.clock()
+                prof.add_time("selection", t2 - t1)
             if p.start_time is None:
                 p.start_time = t  # Registrar primera ejecución
-            p.state = "Ejecutando"
+            if track:
+                p.state = ProcessState.EJECUTANDO
             start = t
             t += run_time
             p.remaining_time -= run_time
             timeline.add_slot(p.id, start, t)  # Registrar ejecución en el diagrama de Gantt
+            if prof is not None:
+                t3 = prof.clock()
+                prof.slot_appends += 1
+                prof.add_time("timeline", t3 - t2)
 
             # Ingresar nuevos procesos que hayan llegado durante este quantum
             while idx < n and procs[idx].arrival_time <= t:
                 queue.append(procs[idx])
-                procs[idx].state = "Listo"
+                if track:
+                    procs[idx].state = ProcessState.LISTO
                 idx += 1
+            if prof is not None:
+                prof.add_time("admission", prof.clock() - t3)
 
             if p.remaining_time > 0:
                 # Si el proceso no terminó, vuelve al final de la cola
-                p.state = "Listo"
+                if track:
+                    p.state = ProcessState.LISTO
                 queue.append(p)
+                if prof is not None:
+                    prof.preemptions += 1  # Expiró el quantum con trabajo pendiente
             else:
                 # Si terminó, registrar tiempo de finalización
-                p.state = "Terminado"
+                if track:
+                    p.state = ProcessState.TERMINADO
                 p.completion_time = t
                 finished += 1
 
+        if prof is not None:
+            prof.slots_emitted += len(timeline.slots)
+
         # Devolver timeline y lista completa de procesos con métricas
         return timeline, procs
@@ -1,5 +1,5 @@
 from typing import List, Tuple
-from models.process import Process
+from models.process import Process, ProcessState
 from core.timeline import Timeline
 
 class SJFNonPreemptive:
@@ -9,6 +9,7 @@ class SJFNonPreemptive:
     - Una vez que un proceso comienza a ejecutarse, no se interrumpe hasta finalizar.
     """
     name = "SJF (no apropiativo)"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
 
     def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
         """
@@ -21,6 +22,7 @@ class SJFNonPreemptive:
         procs = sorted(processes, key=lambda p: (p.arrival_time, p.id))
         t = 0  # Tiempo actual de la simulación
         timeline = Timeline()  # Acumula los segmentos de ejecución
+        track = self.track_state  # Registrar estados por despacho (opcional)
         completed = 0  # Contador de procesos completados
         n = len(procs)  # Número total de procesos
 
@@ -38,7 +40,8 @@ class SJFNonPreemptive:
 
             # Seleccionar el proceso con menor tiempo de ráfaga (criterio SJF)
             p = min(ready, key=lambda p: p.burst_time)
-            p.state = "Ejecutando"
+            if track:
+                p.state = ProcessState.EJECUTANDO
 
             # Registrar el tiempo de inicio si es la primera vez que ejecuta
             if p.start_time is None:
@@ -49,7 +52,8 @@ class SJFNonPreemptive:
             t += p.remaining_time
             p.remaining_time = 0
             p.completion_time = t
-            p.state = "Terminado"
+            if track:
+                p.state = ProcessState.TERMINADO
             completed += 1
 
             # Agregar el segmento al diagrama de Gantt
@@ -1,7 +1,8 @@
 import copy
-from typing import List, Tuple
-from models.process import Process
+from typing import List, Optional, Tuple
+from models.process import Process, ProcessState
 from core.timeline import Timeline
+from core.profiling import SchedulerProfile
 
 class SRTF:
     """
@@ -10,8 +11,11 @@ class SRTF:
     - Siempre selecciona el proceso con menor tiempo restante de ejecución.
     - Si llega un nuevo proceso con menor tiempo restante, interrumpe al actual.
     """
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
+
     def __init__(self):
         self.name = "SRTF (Shortest Remaining Time First)"
+        self.profiler: Optional[SchedulerProfile] = None  # Instrumentación opcional
 
     def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
         """
@@ -23,43 +27,74 @@ class SRTF:
         # Copiamos los procesos para no modificar la lista original
         procs = [copy.deepcopy(p) for p in processes]
         timeline = Timeline()  # Acumula los segmentos de ejecución
+        track = self.track_state  # Registrar estados por despacho (opcional)
         time = 0               # Tiempo actual de la simulación
         ready_queue = []       # Cola de procesos listos para ejecutar
         waiting = sorted(procs, key=lambda p: p.arrival_time)  # Procesos ordenados por llegada
         completed = 0          # Contador de procesos completados
         n = len(procs)         # Número total de procesos
 
+        prof = self.profiler   # None => instrumentación desactivada
+        last = None            # Proceso que ejecutó en la unidad anterior
+
         # Bucle principal: se ejecuta hasta que todos los procesos terminen
         while completed < n:
+            if prof is not None:
+                t0 = prof.clock()
             # Agregar procesos que llegan en este tiempo a la cola de listos
             while waiting and waiting[0].arrival_time <= time:
                 ready_queue.append(waiting.pop(0))
+            if prof is not None:
+                t1 = prof.clock()
+                prof.add_time("admission", t1 - t0)
 
             if ready_queue:
                 # Elegir el proceso con menor tiempo restante (criterio SRTF)
                 ready_queue.sort(key=lambda p: p.remaining_time)
                 current = ready_queue[0]
 
+                if prof is not None:
+                    prof.dispatches += 1
+                    prof.sample_ready(len(ready_queue))
+                    # Desalojo: el proceso anterior sigue pendiente pero se elige otro
+                    if last is not None and last is not current and last.remaining_time > 0:
+                        prof.preemptions += 1
+                    t2 = prof.clock()
+                    prof.add_time("selection", t2 - t1)
+
                 # Si es la primera vez que ejecuta, registrar start_time
                 if current.start_time is None:
                     current.start_time = time
-                current.state = "Ejecutando"
+                if track:
+                    current.state = ProcessState.EJECUTANDO
 
                 # Ejecutar 1 unidad de tiempo
                 timeline.add_slot(current.id, time, time + 1)
+                if prof is not None:
+                    prof.slot_appends += 1
+                    prof.add_time("timeline", prof.clock() - t2)
                 current.remaining_time -= 1
                 time += 1
+                last = current
 
                 # Si el proceso termina, registrar completion_time y sacarlo de la cola
                 if current.remaining_time == 0:
                     current.completion_time = time
-                    current.state = "Terminado"
+                    if track:
+                        current.state = ProcessState.TERMINADO
                     ready_queue.pop(0)
                     completed += 1
             else:
                 # Si no hay procesos listos, la CPU está inactiva (idle)
                 timeline.add_slot(None, time, time + 1)
                 time += 1
+                last = None
+                if prof is not None:
+                    prof.slot_appends += 1
+                    prof.add_time("timeline", prof.clock() - t1)
+
+        if prof is not None:
+            prof.slots_emitted += len(timeline.slots)
 
         # Devolver timeline y lista completa de procesos con métricas
         return timeline, procs
@@ -0,0 +1,99 @@
+import heapq
+from typing import Dict, List, Optional, Tuple
+from models.process import Process, ProcessState
+from core.timeline import Timeline
+from core.proportional import default_tickets
+
+# Constante de stride: stride = STRIDE1 // tickets
+STRIDE1 = 1 << 20
+
+class StrideScheduler:
+    """
+    Algoritmo de planificación stride (proporcional y determinista).
+    - Cada proceso avanza su "pass" en stride = STRIDE1 / tickets por quantum ejecutado;
+      siempre se ejecuta el de menor pass, así que la CPU se reparte según los tickets.
+    - Los pass se mantienen en un heap: O(log n) por decisión.
+    - Un proceso que llega se incorpora con el pass mínimo actual, para no acaparar la CPU.
+    """
+    name = "Stride"
+    track_state = True  # False => no se escribe `state` en cada despacho (modo liviano)
+
+    def __init__(self, quantum: int = 1, tickets: Optional[Dict[str, int]] = None):
+        """
+        Inicializa el planificador.
+        - quantum: unidades de tiempo por decisión (mayor a 0).
+        - tickets: tickets por ID de proceso; los que falten se derivan de la prioridad.
+        """
+        if quantum <= 0:
+            raise ValueError("El quantum debe ser mayor a 0.")
+        self.quantum = quantum
+        self.tickets = tickets or {}
+
+    def tickets_for(self, p: Process) -> int:
+        """Devuelve los tickets asignados a un proceso."""
+        tickets = self.tickets.get(p.id)
+        return default_tickets(p.priority) if tickets is None else tickets
+
+    def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
+        """
+        Ejecuta el algoritmo stride sobre una lista de procesos.
+        - Devuelve:
+            • Un objeto Timeline con el diagrama de Gantt.
+            • La lista de procesos con métricas calculadas (inicio, finalización, etc.).
+        """
+        # Orden inicial de procesos por tiempo de llegada y luego por ID
+        procs = sorted(processes, key=lambda p: (p.arrival_time, p.id))
+        n = len(procs)
+        strides = []
+        for p in procs:
+            tickets = self.tickets_for(p)
+            if tickets <= 0:
+                raise ValueError("Cada proceso debe tener al menos 1 ticket.")
+            strides.append(STRIDE1 // tickets)
+        timeline = Timeline()
+        track = self.track_state  # Registrar estados por despacho (opcional)
+        ready: list = []  # Heap de (pass, orden de llegada)
+        global_pass = 0   # Pass del último proceso despachado
+        t = 0
+        idx = 0
+        finished = 0
+
+        while finished < n:
+            # Ingresar procesos que llegaron hasta el tiempo actual
+            while idx < n and procs[idx].arrival_time <= t:
+                start_pass = ready[0][0] if ready else global_pass
+                heapq.heappush(ready, (start_pass, idx))
+                if track:
+                    procs[idx].state = ProcessState.LISTO
+                idx += 1
+
+            if not ready:
+                # CPU idle hasta el próximo arribo
+                timeline.add_slot(None, t, procs[idx].arrival_time)
+                t = procs[idx].arrival_time
+                continue
+
+            # Ejecutar el proceso con menor pass
+            pass_value, i = heapq.heappop(ready)
+            global_pass = pass_value
+            p = procs[i]
+            run_time = min(self.quantum, p.remaining_time)
+            if p.start_time is None:
+                p.start_time = t
+            if track:
+                p.state = ProcessState.EJECUTANDO
+            timeline.add_slot(p.id, t, t + run_time)
+            t += run_time
+            p.remaining_time -= run_time
+
+            if p.remaining_time == 0:
+                if track:
+                    p.state = ProcessState.TERMINADO
+                p.completion_time = t
+                finished += 1
+            else:
+                if track:
+                    p.state = ProcessState.LISTO
+                heapq.heappush(ready, (pass_value + strides[i], i))
+
+        return timeline, procs
@@ -0,0 +1,145 @@
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from models.process import Process
+from core.scheduler import IScheduler, deep_reset
+from core.partition import busy_period_starts
+from core.parallel import SUPPORTED as PERIOD_INDEPENDENT
+
+
+@dataclass
+class ApproximateResult:
+    """
+    Métricas aproximadas de un algoritmo obtenidas simulando una muestra de períodos ocupados.
+    - metrics: estimación de avg_turnaround, avg_waiting, avg_response y cpu_utilization.
+    - error_bounds: semiamplitud del intervalo de confianza de cada métrica (± valor).
+    - La utilización de CPU no depende del algoritmo y se calcula de forma exacta (error 0).
+    - stateful: el algoritmo arrastra estado entre períodos ocupados (vruntime de CFS, el
+      generador de Lotería, ...), así que simular períodos aislados es solo una aproximación
+      y los márgenes no cubren ese sesgo.
+    """
+    metrics: Dict[str, float] = field(default_factory=dict)
+    error_bounds: Dict[str, float] = field(default_factory=dict)
+    periods_total: int = 0
+    periods_sampled: int = 0
+    processes_sampled: int = 0
+    stateful: bool = False
+
+
+def split_busy_periods(processes: List[Process]) -> List[List[Process]]:
+    """
+    Divide la carga en períodos ocupados independientes (ordenados por llegada).
+    - Entre dos períodos la CPU queda idle sin trabajo pendiente: el `Timeline` de cualquier
+      algoritmo tiene ahí un slot `None`, y la simulación de un período no afecta a otro.
+    """
+    ordered = sorted(processes, key=lambda p: p.arrival_time)
+    starts = busy_period_starts(ordered)
+    bounds = starts + [len(ordered)]
+    return [ordered[bounds[k]:bounds[k + 1]] for k in range(len(starts))]
+
+
+def simulate_period(scheduler: IScheduler, period: List[Process]) -> Tuple[int, int, int, int]:
+    """
+    Simula un período ocupado de forma aislada (desplazado para comenzar en t=0).
+    - Devuelve (cantidad de procesos, suma de turnaround, suma de espera, suma de respuesta).
+    - Es una función de módulo para poder ejecutarse en procesos del pool.
+    """
+    procs = deep_reset(period)
+    base = procs[0].arrival_time
+    for p in procs:
+        p.arrival_time -= base
+    _, finalized = scheduler.run(procs)
+    return _totals(finalized)
+
+
+def _totals(finalized: List[Process]) -> Tuple[int, int, int, int]:
+    """Cantidad de procesos y sumas de turnaround, espera y respuesta."""
+    turnaround = waiting = response = 0
+    for p in finalized:
+        tat = p.completion_time - p.arrival_time
+        turnaround += tat
+        waiting += tat - p.burst_time
+        response += p.start_time - p.arrival_time
+    return len(finalized), turnaround, waiting, response
+
+
+def _simulate_batch(scheduler: IScheduler, periods: List[List[Process]]) -> List[Tuple[int, int, int, int]]:
+    """Simula varios períodos en un mismo proceso del pool (amortiza el costo de envío)."""
+    return [simulate_period(scheduler, period) for period in periods]
+
+
+def approximate_simulation(processes: List[Process], scheduler: IScheduler,
+                           sample_periods: int = 200, workers: Optional[int] = None,
+                           z: float = 1.96, seed: Optional[int] = 0) -> ApproximateResult:
+    """
+    Estima las métricas del sistema simulando solo una muestra de períodos ocupados.
+    - Se sortean `sample_periods` períodos con probabilidad proporcional a su cantidad de
+      procesos (con reposición): los períodos largos, que concentran la espera, no se pierden.
+    - Los períodos sorteados se simulan en paralelo con `workers` procesos
+      (1 => en el proceso actual); un período repetido se simula una sola vez.
+    - Cada promedio se estima como la media de los promedios por período sorteado
+      (estimador de Hansen-Hurwitz, insesgado) y se informa un intervalo de confianza
+      aproximado de nivel `z` (1.96 ≈ 95%).
+    - Si la muestra cubriría todos los períodos el resultado es exacto (error 0): los algoritmos
+      que se reinician en cada hueco idle (`core.parallel.SUPPORTED`) simulan todos los períodos
+      por separado; el resto se simula sobre la carga completa, sin dividirla.
+    - Para los demás algoritmos la estimación muestreada queda marcada con `stateful=True`.
+    """
+    if not processes:
+        raise ValueError("La carga de trabajo está vacía.")
+    if sample_periods <= 0:
+        raise ValueError("sample_periods debe ser mayor a 0.")
+    periods = split_busy_periods(processes)
+    total = len(periods)
+    exact = sample_periods >= total
+    if exact:
+        draws = list(range(total))
+    else:
+        draws = random.Random(seed).choices(range(total), weights=[len(p) for p in periods],
+                                            k=sample_periods)
+    unique = sorted(set(draws))
+    chosen = [periods[k] for k in unique]
+    stateful = not isinstance(scheduler, PERIOD_INDEPENDENT)
+
+    workers = workers or os.cpu_count() or 1
+    if exact and stateful:
+        # El estado cruza los huecos idle: solo la simulación completa es exacta
+        simulated = [_totals(scheduler.run(deep_reset(processes))[1])]
+    elif workers == 1 or len(chosen) == 1:
+        simulated = _simulate_batch(scheduler, chosen)
+    else:
+        size = max(1, len(chosen) // (workers * 4))  # ~4 lotes por proceso para balancear la carga
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batches = [chosen[i:i + size] for i in range(0, len(chosen), size)]
+            simulated = [r for part in pool.map(_simulate_batch, [scheduler] * len(batches), batches)
+                         for r in part]
+    by_period = dict(zip(unique, simulated))
+
+    result = ApproximateResult(periods_total=total, periods_sampled=len(unique),
+                               processes_sampled=sum(r[0] for r in simulated),
+                               stateful=stateful and not exact)
+    m = len(draws)
+    for key, col in (("avg_turnaround", 1), ("avg_waiting", 2), ("avg_response", 3)):
+        if exact:
+            result.metrics[key] = sum(r[col] for r in simulated) / result.processes_sampled
+            result.error_bounds[key] = 0.0
+            continue
+        values = [by_period[k][col] / by_period[k][0] for k in draws]
+        mean = sum(values) / m
+        result.metrics[key] = mean
+        if m > 1:
+            variance = sum((v - mean) ** 2 for v in values) / (m - 1)
+            result.error_bounds[key] = z * math.sqrt(variance / m)
+        else:
+            result.error_bounds[key] = math.inf
+
+    # Utilización exacta: trabajo total / fin del último período (el timeline empieza en t=0)
+    last = periods[-1]
+    end = last[0].arrival_time + sum(p.burst_time for p in last)
+    busy = sum(p.burst_time for p in processes)
+    result.metrics["cpu_utilization"] = busy / end * 100 if end > 0 else 0.0
+    result.error_bounds["cpu_utilization"] = 0.0
+    return result
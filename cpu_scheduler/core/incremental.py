@@ -0,0 +1,206 @@
+import heapq
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from models.process import Process, ProcessState
+from core.timeline import Timeline
+from core.scheduler import IScheduler, deep_reset
+from core.algorithms.fcfs import FCFS
+from core.algorithms.sjf import SJFNonPreemptive
+
+
+@dataclass
+class _Checkpoint:
+    """
+    Estado del simulador en un instante de decisión (justo después de admitir llegadas).
+    - `idx`: cantidad de procesos admitidos (prefijo de la lista ordenada por llegada).
+    - `done`: cantidad de procesos terminados (prefijo del orden de finalización).
+    - `n_slots` / `last_end`: tamaño del timeline y fin del último slot en ese momento.
+    - `ready`: copia de la cola de listos (heap) en ese momento.
+    """
+    t: int
+    idx: int
+    done: int
+    n_slots: int
+    last_end: int
+    ready: list
+
+
+class CheckpointedSimulation:
+    """
+    Simulación con checkpoints para análisis "what-if" sobre FCFS y SJF no apropiativo.
+    - Ejecuta el algoritmo guardando el estado cada `interval` decisiones de despacho.
+    - Al editar un proceso (`update`), retoma desde el último checkpoint anterior a la
+      llegada del proceso editado (antes y después del cambio) y re-simula solo el sufijo,
+      reutilizando el prefijo del `Timeline` y de los procesos ya terminados.
+    - Agregar (`insert`) o quitar (`remove`) un proceso retoma del mismo modo desde su llegada.
+    - El resultado es idéntico al de ejecutar el scheduler de referencia desde t=0.
+    """
+    SUPPORTED = (FCFS, SJFNonPreemptive)
+
+    def __init__(self, scheduler: IScheduler, processes: List[Process], interval: int = 1024):
+        if not isinstance(scheduler, self.SUPPORTED):
+            raise ValueError("La re-simulación incremental solo admite FCFS y SJF no apropiativo.")
+        if interval <= 0:
+            raise ValueError("El intervalo de checkpoints debe ser mayor a 0.")
+        self.scheduler = scheduler
+        self.interval = interval
+        # FCFS despacha en orden de llegada; SJF por ráfaga (desempate por orden de llegada)
+        self._by_burst = isinstance(scheduler, SJFNonPreemptive)
+        self.procs = sorted(deep_reset(processes), key=lambda p: (p.arrival_time, p.id))
+        self._by_id: Dict[str, Process] = {}
+        for p in self.procs:
+            self._by_id.setdefault(p.id, p)
+        self.timeline = Timeline()
+        self._order: List[Process] = []  # Procesos en orden de finalización
+        self._checkpoints: List[_Checkpoint] = []
+        self.resumed_from: Optional[int] = None  # Instante desde el que se retomó la última edición
+        self._simulate(_Checkpoint(t=0, idx=0, done=0, n_slots=0, last_end=0, ready=[]))
+
+    def result(self) -> Tuple[Timeline, List[Process]]:
+        """Devuelve el timeline y los procesos (ordenados por llegada) de la simulación actual."""
+        return self.timeline, self.procs
+
+    @property
+    def checkpoint_times(self) -> List[int]:
+        """Instantes de los checkpoints vigentes (en orden creciente)."""
+        return [cp.t for cp in self._checkpoints]
+
+    def update(self, process_id: str, arrival_time: Optional[int] = None,
+               burst_time: Optional[int] = None,
+               priority: Optional[int] = None) -> Tuple[Timeline, List[Process]]:
+        """
+        Modifica un proceso y actualiza la simulación re-ejecutando solo lo afectado.
+        - Los atributos en None no se modifican.
+        - La prioridad no influye en FCFS ni en SJF, por lo que cambiarla no re-simula nada.
+        - Devuelve el nuevo timeline y la lista de procesos con métricas.
+        """
+        p = self._by_id.get(process_id)
+        if p is None:
+            raise KeyError(f"Proceso {process_id} no encontrado.")
+        if priority is not None:
+            p.priority = priority
+        new_arrival = p.arrival_time if arrival_time is None else arrival_time
+        new_burst = p.burst_time if burst_time is None else burst_time
+        if new_arrival < 0 or new_burst <= 0:
+            raise ValueError("Llegada no negativa y ráfaga positiva requeridas.")
+        if new_arrival == p.arrival_time and new_burst == p.burst_time:
+            self.resumed_from = None
+            return self.result()
+
+        # Hasta la llegada del proceso (antigua y nueva) ninguna de las dos versiones influyó en el plan
+        cp = self._rewind(min(p.arrival_time, new_arrival))
+        p.arrival_time = new_arrival
+        p.burst_time = new_burst
+        if arrival_time is not None:
+            self.procs.sort(key=lambda q: (q.arrival_time, q.id))
+        self._resume(cp)
+        return self.result()
+
+    def insert(self, process: Process) -> Tuple[Timeline, List[Process]]:
+        """
+        Agrega un proceso a la carga y actualiza la simulación desde su llegada.
+        - El ID debe ser nuevo: es el que usan `update` y `remove` para identificarlo.
+        - Devuelve el nuevo timeline y la lista de procesos con métricas.
+        """
+        if process.id in self._by_id:
+            raise ValueError(f"Ya existe un proceso con ID {process.id}.")
+        if process.arrival_time < 0 or process.burst_time <= 0:
+            raise ValueError("Llegada no negativa y ráfaga positiva requeridas.")
+        p = deep_reset([process])[0]
+        cp = self._rewind(p.arrival_time)
+        insort(self.procs, p, key=lambda q: (q.arrival_time, q.id))
+        self._by_id[p.id] = p
+        self._resume(cp)
+        return self.result()
+
+    def remove(self, process_id: str) -> Tuple[Timeline, List[Process]]:
+        """
+        Quita un proceso de la carga y actualiza la simulación desde su llegada.
+        - Devuelve el nuevo timeline y la lista de procesos con métricas.
+        """
+        p = self._by_id.pop(process_id, None)
+        if p is None:
+            raise KeyError(f"Proceso {process_id} no encontrado.")
+        cp = self._rewind(p.arrival_time)
+        del self.procs[next(i for i, q in enumerate(self.procs) if q is p)]
+        for q in self.procs:
+            if q.id == process_id:
+                self._by_id[q.id] = q  # Otro proceso con el mismo ID pasa a ser el direccionable
+                break
+        self._resume(cp)
+        return self.result()
+
+    def _rewind(self, limit: int) -> _Checkpoint:
+        """
+        Devuelve el último checkpoint tomado antes de `limit` y descarta los posteriores.
+        - Hasta ese instante un cambio en un proceso que llega en `limit` no influye en el plan:
+          los procesos admitidos y la cola de listos del checkpoint siguen siendo válidos.
+        """
+        pos = bisect_left(self.checkpoint_times, limit) - 1
+        cp = self._checkpoints[pos] if pos >= 0 else _Checkpoint(0, 0, 0, 0, 0, [])
+        del self._checkpoints[max(pos, 0):]
+        return cp
+
+    def _resume(self, cp: _Checkpoint):
+        """Reinicia los procesos no terminados antes de `cp` y re-simula desde ahí."""
+        # Los procesos terminados antes del checkpoint conservan sus métricas
+        kept = {id(q) for q in self._order[:cp.done]}
+        del self._order[cp.done:]
+        for q in self.procs:
+            if id(q) not in kept:
+                q.reset_runtime()
+        self.resumed_from = cp.t
+        self._simulate(cp)
+
+    def _simulate(self, cp: _Checkpoint):
+        """
+        Ejecuta la simulación a partir del checkpoint `cp` hasta terminar todos los procesos.
+        - Restaura timeline y cola de listos, y registra nuevos checkpoints cada `interval` decisiones.
+        """
+        procs = self.procs
+        n = len(procs)
+        timeline = self.timeline
+        del timeline.slots[cp.n_slots:]
+        if timeline.slots:
+            timeline.slots[-1].end = cp.last_end  # Deshace fusiones posteriores al checkpoint
+        t, idx = cp.t, cp.idx
+        ready = list(cp.ready)
+        order = self._order
+        track = self.scheduler.track_state  # Respeta el modo sin registro de estados
+        decisions = 0
+
+        while len(order) < n:
+            # Admitir procesos que llegaron hasta el tiempo actual
+            while idx < n and procs[idx].arrival_time <= t:
+                q = procs[idx]
+                # Clave SJF: (ráfaga, orden de llegada); FCFS: solo orden de llegada
+                heapq.heappush(ready, (q.burst_time if self._by_burst else 0, idx, q))
+                idx += 1
+
+            if not ready:
+                # CPU idle hasta el próximo arribo
+                timeline.add_slot(None, t, procs[idx].arrival_time)
+                t = procs[idx].arrival_time
+                continue
+
+            if decisions % self.interval == 0:
+                last_end = timeline.slots[-1].end if timeline.slots else 0
+                self._checkpoints.append(
+                    _Checkpoint(t, idx, len(order), len(timeline.slots), last_end, list(ready)))
+            decisions += 1
+
+            # Ejecutar el proceso elegido hasta terminar (no apropiativo)
+            _, _, p = heapq.heappop(ready)
+            if track:
+                p.state = ProcessState.EJECUTANDO
+            if p.start_time is None:
+                p.start_time = t
+            start = t
+            t += p.remaining_time
+            p.remaining_time = 0
+            p.completion_time = t
+            if track:
+                p.state = ProcessState.TERMINADO
+            order.append(p)
+            timeline.add_slot(p.id, start, t)
@@ -0,0 +1,117 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from models.process import Process
+from core.timeline import Timeline
+from core.scheduler import IScheduler, deep_reset
+from core.partition import busy_period_starts
+from core.algorithms.fcfs import FCFS
+from core.algorithms.sjf import SJFNonPreemptive
+from core.algorithms.srtf import SRTF
+from core.algorithms.priority import PriorityScheduler
+
+# Algoritmos cuyo estado se reinicia por completo cuando la CPU queda idle sin pendientes
+SUPPORTED = (FCFS, SJFNonPreemptive, SRTF, PriorityScheduler)
+
+# Resultado de un segmento: slots (pid, inicio, fin) y procesos, ya en tiempo absoluto
+SegmentResult = Tuple[List[Tuple[Optional[str], int, int]], List[Process]]
+
+
+def _run_segment(scheduler: IScheduler, segment: List[Process]) -> SegmentResult:
+    """
+    Simula un período ocupado desplazado a t=0 y devuelve sus resultados en tiempo absoluto.
+    - El desplazamiento evita que los algoritmos recorran el tiempo idle previo al período.
+    """
+    base = segment[0].arrival_time
+    for p in segment:
+        p.arrival_time -= base
+    timeline, finalized = scheduler.run(segment)
+    for p in finalized:
+        p.arrival_time += base
+        p.start_time += base
+        p.completion_time += base
+    slots = [(s.process_id, s.start + base, s.end + base) for s in timeline.slots]
+    return slots, finalized
+
+
+def _run_batch(scheduler: IScheduler, segments: List[List[Process]]) -> List[SegmentResult]:
+    """Simula varios segmentos en un mismo proceso del pool (amortiza el costo de envío)."""
+    return [_run_segment(scheduler, segment) for segment in segments]
+
+
+def parallel_run(scheduler: IScheduler, processes: List[Process],
+                 workers: Optional[int] = None) -> Tuple[Timeline, List[Process]]:
+    """
+    Ejecuta un algoritmo dividiendo la carga en períodos ocupados simulados en paralelo.
+    - Admite FCFS, SJF no apropiativo, SRTF y Prioridades: su plan dentro de un período no
+      depende de los anteriores, porque la cola de listos queda vacía entre períodos.
+    - Une los segmentos del `Timeline` (con los slots idle entre períodos) y los procesos,
+      obteniendo exactamente el mismo resultado que una ejecución serial.
+    - Con un solo worker (o un único período) simula todo en el proceso actual; aun así
+      evita los costos cuadráticos de los algoritmos sobre la carga completa.
+    """
+    if not isinstance(scheduler, SUPPORTED):
+        raise ValueError("La simulación paralela exacta solo admite FCFS, SJF, SRTF y Prioridades.")
+    # Orden estable por llegada: conserva el orden relativo de la entrada ante empates (SRTF)
+    order = sorted(range(len(processes)), key=lambda i: processes[i].arrival_time)
+    ordered = deep_reset([processes[i] for i in order])
+    starts = busy_period_starts(ordered)
+    bounds = starts + [len(ordered)]
+    segments = [ordered[bounds[k]:bounds[k + 1]] for k in range(len(starts))]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(segments) <= 1:
+        results = _run_batch(scheduler, segments)
+    else:
+        # Lotes contiguos de tamaño similar (en procesos), ~4 por worker para balancear
+        target = max(1, len(ordered) // (workers * 4))
+        batches: List[List[List[Process]]] = [[]]
+        size = 0
+        for segment in segments:
+            if size >= target:
+                batches.append([])
+                size = 0
+            batches[-1].append(segment)
+            size += len(segment)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [r for part in pool.map(_run_batch, [scheduler] * len(batches), batches)
+                       for r in part]
+
+    # Unir segmentos: idle entre períodos (y antes del primero, como en la ejecución serial)
+    timeline = Timeline()
+    finalized: List[Process] = []
+    t = 0
+    for slots, procs in results:
+        first_start = slots[0][1]
+        timeline.add_slot(None, t, first_start)
+        for pid, start, end in slots:
+            timeline.add_slot(pid, start, end)
+        t = slots[-1][2]
+        finalized.extend(procs)
+
+    if isinstance(scheduler, SRTF):
+        # SRTF devuelve los procesos en el orden de entrada (el resto, ordenados por llegada e ID):
+        # cada segmento conserva su orden, así que se reubican según la posición original.
+        by_position = [None] * len(finalized)
+        for pos, p in zip(order, finalized):
+            by_position[pos] = p
+        finalized = by_position
+    return timeline, finalized
+
+
+class ParallelScheduler:
+    """
+    Adaptador que ejecuta un scheduler admitido mediante `parallel_run`.
+    - Cumple el protocolo `IScheduler`, así que puede usarse en `run_simulation`
+      y en la tabla comparativa como cualquier otro algoritmo.
+    """
+    def __init__(self, inner: IScheduler, workers: Optional[int] = None):
+        if not isinstance(inner, SUPPORTED):
+            raise ValueError("La simulación paralela exacta solo admite FCFS, SJF, SRTF y Prioridades.")
+        self.inner = inner
+        self.workers = workers
+        self.name = inner.name
+
+    def run(self, processes: List[Process]) -> Tuple[Timeline, List[Process]]:
+        """Ejecuta el scheduler interno en paralelo por períodos ocupados."""
+        return parallel_run(self.inner, processes, self.workers)
@@ -0,0 +1,21 @@
+from typing import List
+from models.process import Process
+
+
+def busy_period_starts(ordered: List[Process]) -> List[int]:
+    """
+    Encuentra los límites de los períodos ocupados de una carga ordenada por llegada.
+    - Un período ocupado termina cuando la CPU se queda sin trabajo: la siguiente llegada
+      ocurre estrictamente después de que terminó todo lo que había llegado antes.
+    - Es independiente del algoritmo para cualquier política conservativa del trabajo
+      (la CPU nunca queda idle con procesos listos), como todas las del simulador.
+    - Devuelve los índices (en `ordered`) donde comienza cada período; el primero es 0.
+    """
+    starts: List[int] = []
+    finish = None  # Instante en que se vacía la CPU con lo llegado hasta ahora
+    for i, p in enumerate(ordered):
+        if finish is None or p.arrival_time > finish:
+            starts.append(i)
+            finish = p.arrival_time
+        finish += p.burst_time
+    return starts
@@ -0,0 +1,63 @@
+from time import perf_counter
+from typing import Dict
+
+# Fases instrumentadas dentro del bucle de un scheduler (más el cálculo de métricas)
+PHASES = ("admission", "selection", "timeline", "metrics")
+
+
+class SchedulerProfile:
+    """
+    Contadores de instrumentación para el bucle principal de un scheduler.
+    - Es opcional: los algoritmos solo lo usan si tienen un `profiler` asignado,
+      de modo que con la instrumentación desactivada el costo es una comparación con None.
+    - Registra:
+        • dispatches: decisiones de despacho (selección de un proceso para ejecutar).
+        • preemptions: procesos desalojados con tiempo restante pendiente.
+        • slot_appends: llamadas a `Timeline.add_slot` y slots finales emitidos.
+        • Longitud de la cola de listos (máxima y promedio por decisión).
+        • Tiempo acumulado por fase (admisión, selección, timeline, métricas).
+    """
+    def __init__(self):
+        self.dispatches = 0
+        self.preemptions = 0
+        self.slot_appends = 0
+        self.slots_emitted = 0
+        self.ready_samples = 0
+        self.ready_total = 0
+        self.ready_max = 0
+        self.phase_time: Dict[str, float] = {phase: 0.0 for phase in PHASES}
+
+    @staticmethod
+    def clock() -> float:
+        """Reloj de alta resolución usado para medir las fases."""
+        return perf_counter()
+
+    def add_time(self, phase: str, elapsed: float):
+        """Acumula `elapsed` segundos en la fase indicada."""
+        self.phase_time[phase] += elapsed
+
+    def sample_ready(self, length: int):
+        """Registra la longitud de la cola de listos en una decisión de despacho."""
+        self.ready_samples += 1
+        self.ready_total += length
+        if length > self.ready_max:
+            self.ready_max = length
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Exporta los contadores como un diccionario plano (apto para JSON o tablas).
+        - Los tiempos por fase se expresan en segundos con el prefijo `time_`.
+        """
+        avg_ready = self.ready_total / self.ready_samples if self.ready_samples else 0.0
+        data: Dict[str, float] = {
+            "dispatches": self.dispatches,
+            "preemptions": self.preemptions,
+            "slot_appends": self.slot_appends,
+            "slots_emitted": self.slots_emitted,
+            "ready_max": self.ready_max,
+            "ready_avg": avg_ready,
+        }
+        for phase, seconds in self.phase_time.items():
+            data[f"time_{phase}"] = seconds
+        return data
+
@@ -0,0 +1,49 @@
+from typing import List
+
+# Tickets que recibe un proceso de prioridad 0 (la más alta)
+BASE_TICKETS = 100
+
+
+def default_tickets(priority: int) -> int:
+    """
+    Asigna tickets a partir de la prioridad del proceso (menor número = mayor prioridad).
+    - Prioridad 0 => BASE_TICKETS; prioridad k => BASE_TICKETS // (k + 1), con mínimo 1.
+    """
+    return max(1, BASE_TICKETS // (max(priority, 0) + 1))
+
+
+class FenwickTree:
+    """
+    Árbol de Fenwick (Binary Indexed Tree) sobre pesos enteros no negativos.
+    - Permite actualizar un peso y buscar el índice que contiene un valor acumulado en O(log n).
+    - Se usa para sortear tickets en el scheduler de lotería sin recorrer todos los procesos.
+    """
+    def __init__(self, size: int):
+        self.size = size
+        self.tree: List[int] = [0] * (size + 1)
+        self.total = 0
+        # Mayor potencia de 2 <= size, para la búsqueda por descenso binario
+        self._top = 1 << (size.bit_length() - 1) if size > 0 else 0
+
+    def add(self, index: int, delta: int):
+        """Suma `delta` al peso de la posición `index` (base 0)."""
+        self.total += delta
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, value: int) -> int:
+        """
+        Devuelve la menor posición cuya suma acumulada (inclusive) supera `value`.
+        - `value` debe estar en [0, total).
+        """
+        pos = 0
+        step = self._top
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= value:
+                pos = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        return pos  # Índice base 0 (pos + 1 en base 1)
@@ -0,0 +1,167 @@
+import heapq
+import math
+from dataclasses import dataclass, replace
+from typing import Callable, List, Optional, Tuple
+from models.process import Process, ProcessState
+from core.timeline import Timeline
+
+# Máximo de trabajos que puede generar la expansión de tareas periódicas (acota tiempo y memoria)
+MAX_JOBS = 200_000
+
+
+class UnschedulableWorkloadError(ValueError):
+    """
+    Se lanza cuando el pre-chequeo de planificabilidad demuestra que la carga
+    no puede cumplir sus plazos (por ejemplo, utilización mayor a 1).
+    """
+
+
+@dataclass
+class SchedulabilityReport:
+    """
+    Resultado del pre-chequeo de planificabilidad de un conjunto de tareas periódicas.
+    - utilization: suma de ráfaga / período.
+    - bound: cota usada por la prueba (1.0 para EDF, Liu & Layland para RM).
+    - schedulable: True (garantizado), False (imposible) o None (la prueba no decide).
+    """
+    utilization: float
+    bound: float
+    schedulable: Optional[bool]
+
+
+def _validate_periods(processes: List[Process]):
+    """Lanza ValueError si alguna tarea tiene un período no positivo."""
+    for p in processes:
+        if p.period is not None and p.period <= 0:
+            raise ValueError(f"Proceso {p.id}: el período debe ser un entero positivo.")
+
+
+def check_schedulability(processes: List[Process], policy: str) -> SchedulabilityReport:
+    """
+    Pre-chequeo analítico de planificabilidad para tareas periódicas (`period` definido).
+    - policy="edf": U > 1 => imposible; densidad (ráfaga / min(plazo, período)) <= 1 => garantizado.
+    - policy="rm": U > 1 => imposible; U <= n(2^(1/n) - 1) con plazos implícitos => garantizado.
+    - Los procesos sin período no participan de la prueba.
+    """
+    _validate_periods(processes)
+    tasks = [p for p in processes if p.period is not None]
+    n = len(tasks)
+    utilization = sum(p.burst_time / p.period for p in tasks)
+    if policy == "edf":
+        bound = 1.0
+        density = sum(p.burst_time / min(p.deadline or p.period, p.period) for p in tasks)
+        sufficient = density <= 1.0
+    elif policy == "rm":
+        bound = n * (2 ** (1 / n) - 1) if n else 1.0
+        implicit = all(p.deadline is None or p.deadline >= p.period for p in tasks)
+        sufficient = implicit and utilization <= bound
+    else:
+        raise ValueError(f"Política de tiempo real desconocida: {policy}")
+
+    if utilization > 1.0:
+        schedulable = False
+    elif sufficient:
+        schedulable = True
+    else:
+        schedulable = None
+    return SchedulabilityReport(utilization, bound, schedulable)
+
+
+def expand_periodic(processes: List[Process], horizon: Optional[int] = None,
+                    max_jobs: int = MAX_JOBS) -> List[Process]:
+    """
+    Expande las tareas periódicas en trabajos individuales hasta `horizon`.
+    - Cada tarea con `period` libera un trabajo en arrival + k*period (k = 0, 1, ...)
+      mientras esa llegada sea menor que el horizonte; el id del trabajo es "<id>#<k>".
+    - El plazo relativo de cada trabajo es `deadline` o, si no hay, el propio período.
+    - Sin horizonte explícito se usa la llegada máxima más el hiperperíodo (mcm de los períodos).
+    - Los procesos sin período se devuelven tal cual (como copias).
+    - Si la expansión generaría más de `max_jobs` trabajos periódicos (por ejemplo, con períodos
+      coprimos el hiperperíodo crece muy rápido) lanza ValueError antes de crear ninguno:
+      se debe indicar un horizonte más corto o aumentar el límite. Los procesos aperiódicos
+      no cuentan para el límite.
+    - Lanza ValueError si algún período no es positivo o si una tarea llega en o después
+      del horizonte (no liberaría ningún trabajo y desaparecería de la simulación).
+    """
+    _validate_periods(processes)
+    tasks = [p for p in processes if p.period is not None]
+    if tasks:
+        if horizon is None:
+            horizon = max(p.arrival_time for p in processes) + math.lcm(*(p.period for p in tasks))
+        late = [p.id for p in tasks if p.arrival_time >= horizon]
+        if late:
+            raise ValueError(f"Las tareas {', '.join(late)} llegan en o después del horizonte "
+                             f"t={horizon} y no liberarían ningún trabajo.")
+
+        # Cantidad de liberaciones periódicas en [arrival, horizon); los aperiódicos no cuentan
+        releases = sum(-(-(horizon - p.arrival_time) // p.period) for p in tasks)
+        if releases > max_jobs:
+            raise ValueError(f"La expansión periódica hasta t={horizon} generaría {releases} trabajos "
+                             f"(máximo {max_jobs}): indique un horizonte menor o aumente max_jobs.")
+
+    jobs: List[Process] = []
+    for p in processes:
+        if p.period is None:
+            jobs.append(replace(p))
+            continue
+        deadline = p.deadline if p.deadline is not None else p.period
+        for k, release in enumerate(range(p.arrival_time, horizon, p.period)):
+            jobs.append(replace(p, id=f"{p.id}#{k}", arrival_time=release, deadline=deadline,
+                                remaining_time=p.burst_time, start_time=None, completion_time=None))
+    return jobs
+
+
+def run_preemptive_by_key(jobs: List[Process], key: Callable[[Process], float],
+                          track_state: bool = True) -> Tuple[Timeline, List[Process]]:
+    """
+    Motor apropiativo dirigido por eventos para políticas de prioridad estática por trabajo.
+    - Siempre ejecuta el trabajo listo con menor `key` (desempate por orden de llegada e ID).
+    - Usa un heap para la cola de listos y solo re-evalúa en llegadas y finalizaciones,
+      de modo que el costo es O(n log n) en lugar de avanzar de a una unidad de tiempo.
+    - Con `track_state=False` no actualiza `state` en cada despacho.
+    """
+    procs = sorted(jobs, key=lambda p: (p.arrival_time, p.id))
+    timeline = Timeline()
+    ready: list = []  # Heap de (clave, orden de llegada, proceso)
+    t = 0
+    idx = 0
+    finished = 0
+    n = len(procs)
+
+    while finished < n:
+        # Admitir los trabajos liberados hasta el instante actual
+        while idx < n and procs[idx].arrival_time <= t:
+            heapq.heappush(ready, (key(procs[idx]), idx, procs[idx]))
+            if track_state:
+                procs[idx].state = ProcessState.LISTO
+            idx += 1
+
+        if not ready:
+            # CPU idle hasta la próxima liberación
+            timeline.add_slot(None, t, procs[idx].arrival_time)
+            t = procs[idx].arrival_time
+            continue
+
+        # Ejecutar el más prioritario hasta que termine o llegue otro trabajo
+        p = ready[0][2]
+        next_arrival = procs[idx].arrival_time if idx < n else math.inf
+        run_time = min(p.remaining_time, next_arrival - t)
+        if p.start_time is None:
+            p.start_time = t
+        if track_state:
+            p.state = ProcessState.EJECUTANDO
+        timeline.add_slot(p.id, t, t + run_time)
+        t += run_time
+        p.remaining_time -= run_time
+
+        if p.remaining_time == 0:
+            heapq.heappop(ready)
+            if track_state:
+                p.state = ProcessState.TERMINADO
+            p.completion_time = t
+            finished += 1
+        else:
+            if track_state:
+                p.state = ProcessState.LISTO
+
+    return timeline, procs
@@ -1,4 +1,4 @@
-from typing import List, Dict, Protocol, Tuple
+from typing import Any, List, Dict, Protocol, Tuple
 from copy import deepcopy
 from models.process import Process
 from core.timeline import Timeline
@@ -40,13 +40,53 @@ def generate_ready_list(processes: List[Process], t: int) -> List[Process]:
     return [p for p in processes if p.arrival_time <= t and p.remaining_time > 0]
 
 
-def pick_best_algorithm(results: Dict[str, Dict[str, float]]) -> str:
+def pick_best_algorithm(results: Dict[str, Dict[str, float]], criterion: str = "avg_waiting") -> str:
     """
     Selecciona automáticamente el 'mejor' algoritmo de planificación.
-    - Criterio actual: menor tiempo promedio de espera (`avg_waiting`).
+    - Criterio por defecto: menor tiempo promedio de espera (`avg_waiting`);
+      `criterion` permite usar otra métrica donde menor es mejor.
     - Recibe un diccionario con métricas por algoritmo.
     - Devuelve el nombre del algoritmo con mejor desempeño.
     - Nota: puede extenderse para incluir ponderaciones o múltiples métricas.
     """
-    best = min(results.items(), key=lambda kv: kv[1]["avg_waiting"])
+    best = min(results.items(), key=lambda kv: kv[1][criterion])
     return best[0]
+
+
+def build_scheduler(name: str, **params: Any) -> IScheduler:
+    """
+    Crea un scheduler a partir de su nombre corto y sus parámetros.
+    - Nombres admitidos: "fcfs", "sjf", "rr" (quantum), "priority" (preemptive), "srtf",
+      "edf" y "rm" (horizon, precheck), "lottery" (quantum, seed, tickets), "stride" (quantum, tickets)
+      y "cfs" (target_latency, min_granularity).
+    - Se usa cuando la selección de algoritmos llega como datos (por ejemplo, desde la API).
+    - Lanza ValueError si el nombre no corresponde a ningún algoritmo.
+    """
+    # Importación diferida: los algoritmos no deben depender de este módulo
+    from core.algorithms.fcfs import FCFS
+    from core.algorithms.sjf import SJFNonPreemptive
+    from core.algorithms.round_robin import RoundRobin
+    from core.algorithms.priority import PriorityScheduler
+    from core.algorithms.srtf import SRTF
+    from core.algorithms.edf import EDF
+    from core.algorithms.rate_monotonic import RateMonotonic
+    from core.algorithms.lottery import LotteryScheduler
+    from core.algorithms.stride import StrideScheduler
+    from core.algorithms.cfs import CFS
+
+    registry = {
+        "fcfs": FCFS,
+        "sjf": SJFNonPreemptive,
+        "rr": RoundRobin,
+        "priority": PriorityScheduler,
+        "srtf": SRTF,
+        "edf": EDF,
+        "rm": RateMonotonic,
+        "lottery": LotteryScheduler,
+        "stride": StrideScheduler,
+        "cfs": CFS,
+    }
+    cls = registry.get(name.lower())
+    if cls is None:
+        raise ValueError(f"Algoritmo desconocido: {name}. Opciones: {', '.join(registry)}")
+    return cls(**params)
@@ -0,0 +1,297 @@
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from models.process import Process
+from core.scheduler import IScheduler, deep_reset, pick_best_algorithm
+from core.partition import busy_period_starts
+from metrics.metrics import compute_system_metrics
+
+
+@dataclass
+class WorkloadStats:
+    """
+    Estadísticas de una carga de trabajo calculadas en una sola pasada.
+    - burst_cv: coeficiente de variación de las ráfagas (0 => todas iguales).
+    - load: trabajo total / intervalo de llegadas (>= 1 => la CPU casi nunca descansa).
+    - priority_spread: diferencia entre la mayor y la menor prioridad.
+    """
+    n: int
+    burst_mean: float
+    burst_cv: float
+    arrival_span: int
+    load: float
+    priority_spread: int
+
+
+@dataclass
+class SelectionReport:
+    """
+    Resultado de la selección rápida de algoritmo.
+    - Los algoritmos se identifican por su etiqueta (ver `scheduler_labels`).
+    - estimates: métricas estimadas con la mini-simulación, por algoritmo.
+    - candidates: algoritmos simulados por completo (los mejores según la estimación).
+    - actual: métricas reales de los candidatos.
+    - errors: error relativo de la estimación del criterio para cada candidato.
+    - best: ganador entre los candidatos según las métricas reales.
+    - sample_size: procesos medidos en la mini-simulación (los de las ventanas).
+    - simulated: procesos simulados por algoritmo, incluido el calentamiento.
+    """
+    stats: WorkloadStats
+    sample_size: int
+    simulated: int
+    estimates: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    candidates: List[str] = field(default_factory=list)
+    actual: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    errors: Dict[str, float] = field(default_factory=dict)
+    best: Optional[str] = None
+
+
+@dataclass
+class SampleWindow:
+    """
+    Ventana de la muestra lista para la mini-simulación.
+    - processes: procesos de calentamiento seguidos de los de la ventana (llegadas desde t=0).
+    - warmup: cuántos de los primeros procesos son de calentamiento (se simulan pero no se miden).
+    """
+    processes: List[Process]
+    warmup: int
+
+    @property
+    def measured(self) -> int:
+        """Cantidad de procesos de la ventana que entran en las métricas."""
+        return len(self.processes) - self.warmup
+
+
+def workload_stats(processes: List[Process]) -> WorkloadStats:
+    """
+    Calcula las estadísticas de la carga en una pasada (media y varianza por Welford).
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    total = 0
+    first = last = None
+    low = high = None
+    for p in processes:
+        n += 1
+        delta = p.burst_time - mean
+        mean += delta / n
+        m2 += delta * (p.burst_time - mean)
+        total += p.burst_time
+        first = p.arrival_time if first is None else min(first, p.arrival_time)
+        last = p.arrival_time if last is None else max(last, p.arrival_time)
+        low = p.priority if low is None else min(low, p.priority)
+        high = p.priority if high is None else max(high, p.priority)
+    if n == 0:
+        return WorkloadStats(0, 0.0, 0.0, 0, 0.0, 0)
+    std = math.sqrt(m2 / n)
+    span = last - first
+    return WorkloadStats(
+        n=n,
+        burst_mean=mean,
+        burst_cv=std / mean if mean > 0 else 0.0,
+        arrival_span=span,
+        load=total / span if span > 0 else math.inf,
+        priority_spread=high - low,
+    )
+
+
+def _period_starts_of(ordered: List[Process]) -> List[int]:
+    """
+    Para cada proceso de una carga ordenada por llegada, el índice donde comienza
+    su período ocupado (ver `busy_period_starts`).
+    """
+    starts = busy_period_starts(ordered)
+    period_of: List[int] = []
+    for k, first in enumerate(starts):
+        last = starts[k + 1] if k + 1 < len(starts) else len(ordered)
+        period_of.extend([first] * (last - first))
+    return period_of
+
+
+def _pending_by_priority(ordered: List[Process], points: List[int]) -> Dict[int, List[Tuple[int, int]]]:
+    """
+    Trabajo pendiente en la CPU justo antes de cada índice de `points`, desglosado por prioridad.
+    - Para cada nivel p, el pendiente de los procesos con prioridad <= p es el backlog de la
+      subcarga de esos procesos: no depende del algoritmo (conservativo del trabajo) y, con
+      planificación por prioridades, aproxima lo que está en cola delante de un proceso de nivel p.
+    - Hace una pasada por cada nivel de prioridad distinto.
+    - Devuelve, por punto, pares (nivel, trabajo de ese nivel) con trabajo positivo.
+    """
+    wanted = set(points)
+    cumulative: Dict[int, List[Tuple[int, int]]] = {i: [] for i in points}
+    for level in sorted({p.priority for p in ordered}):
+        finish = None  # Instante en que se vacía la CPU con lo llegado de nivel <= level
+        for i, p in enumerate(ordered):
+            if i in wanted:
+                cumulative[i].append((level, max(0, finish - p.arrival_time) if finish is not None else 0))
+            if p.priority <= level:
+                finish = max(finish, p.arrival_time) if finish is not None else p.arrival_time
+                finish += p.burst_time
+
+    pending: Dict[int, List[Tuple[int, int]]] = {}
+    for i, levels in cumulative.items():
+        below = 0
+        pending[i] = []
+        for level, work in levels:
+            if work > below:
+                pending[i].append((level, work - below))
+                below = work
+    return pending
+
+
+def _carry_processes(pending: List[Tuple[int, int]], piece: int, limit: int) -> List[Process]:
+    """
+    Representa el trabajo pendiente como procesos que ya esperan en t=0.
+    - Cada nivel de prioridad se reparte en ráfagas de tamaño `piece` (el tamaño medio de la carga).
+    - Para acotar la muestra se crean a lo sumo unas `limit` ráfagas en total (proporcional
+      por nivel); lo que excede queda en una única ráfaga larga por nivel, como los procesos
+      largos que se acumulan cuando la CPU está saturada.
+    """
+    total = sum(work for _, work in pending)
+    carry: List[Process] = []
+    for level, work in pending:
+        count = min(work // piece, limit * work // total)
+        carry.extend(Process("", 0, piece, level) for _ in range(count))
+        if work > count * piece:
+            carry.append(Process("", 0, work - count * piece, level))
+    return carry
+
+
+def sample_workload(processes: List[Process], size: int, rng: random.Random,
+                    windows: int = 4, stats: Optional[WorkloadStats] = None) -> List[SampleWindow]:
+    """
+    Toma una muestra de unos `size` procesos como `windows` ventanas contiguas de llegadas.
+    - Cada ventana empieza en un desplazamiento al azar dentro de su franja de la carga
+      (muestreo estratificado), así también se cubren cargas saturadas con un único período ocupado.
+    - Antes de la ventana se agregan procesos de calentamiento para que la cola de listos
+      no arranque vacía: los anteriores del mismo período ocupado y, si el período empezó antes,
+      el trabajo que seguía pendiente (backlog), por nivel de prioridad y repartido en ráfagas
+      del tamaño medio de la carga (`stats.burst_mean`), como mucho `size` por ventana.
+    - El calentamiento crece con la carga (`stats.load`): con la CPU saturada las colas son largas.
+    - Los IDs se renumeran conservando el orden de llegada y desempate, para separar
+      el calentamiento de lo medido; las llegadas se desplazan para comenzar en t=0.
+    - Lanza ValueError si `size` no es positivo.
+    """
+    if size <= 0:
+        raise ValueError("El tamaño de la muestra debe ser mayor a 0.")
+    ordered = sorted(processes, key=lambda p: (p.arrival_time, p.id))
+    n = len(ordered)
+    if size >= n:
+        return [SampleWindow(deep_reset(ordered), 0)]
+    stats = stats or workload_stats(ordered)
+    windows = max(1, min(windows, size))
+    width = size // windows
+    warmup = max(1, round(width * min(stats.load, 2.0) / 2))
+    mean_burst = max(1, round(stats.burst_mean))
+    period_of = _period_starts_of(ordered)
+
+    stratum = n // windows
+    firsts = [rng.randint(k * stratum, (k + 1) * stratum - width) for k in range(windows)]
+    begins = [max(period_of[first], first - warmup) for first in firsts]
+    pending = _pending_by_priority(ordered, begins)
+
+    samples = []
+    for first, begin in zip(firsts, begins):
+        chunk = deep_reset(ordered[begin:first + width])
+        base = chunk[0].arrival_time
+        for p in chunk:
+            p.arrival_time -= base
+
+        # Trabajo heredado de antes del calentamiento (nada si `begin` abre el período ocupado)
+        carry = _carry_processes(pending[begin], mean_burst, size)
+        chunk = carry + chunk
+        digits = len(str(len(chunk)))
+        for i, p in enumerate(chunk):
+            p.id = f"{i:0{digits}d}"
+        samples.append(SampleWindow(chunk, len(carry) + first - begin))
+    return samples
+
+
+def _estimate(scheduler: IScheduler, samples: List[SampleWindow]) -> Dict[str, float]:
+    """
+    Promedia (ponderando por procesos medidos) las métricas de cada ventana muestreada.
+    - Los procesos de calentamiento se simulan pero no entran en los promedios.
+    """
+    total = sum(window.measured for window in samples)
+    estimate: Dict[str, float] = {}
+    for window in samples:
+        timeline, finalized = scheduler.run(deep_reset(window.processes))
+        measured = finalized
+        if window.warmup:
+            # Los trabajos de tareas periódicas expandidas llevan el sufijo "#k"
+            measured = [p for p in finalized if int(p.id.partition("#")[0]) >= window.warmup]
+        for key, value in compute_system_metrics(measured, timeline).items():
+            estimate[key] = estimate.get(key, 0.0) + value * len(measured) / total
+    return estimate
+
+
+def scheduler_labels(schedulers: List[IScheduler]) -> List[str]:
+    """
+    Etiquetas únicas para una lista de schedulers.
+    - Es el nombre del algoritmo; si se repite (por ejemplo, dos Round Robin), se agregan
+      sus parámetros ("Round Robin (quantum=1)") y, si aun así coinciden, un número de orden.
+    """
+    names = [s.name for s in schedulers]
+    labels = []
+    for s in schedulers:
+        label = s.name
+        if names.count(s.name) > 1:
+            params = {k: v for k, v in sorted(vars(s).items())
+                      if k not in ("name", "profiler", "track_state") and not k.startswith("_")}
+            if params:
+                label += " (" + ", ".join(f"{k}={v}" for k, v in params.items()) + ")"
+        labels.append(label)
+    base = list(labels)
+    for i, label in enumerate(base):
+        if base.count(label) > 1:
+            labels[i] = f"{label} #{base[:i].count(label) + 1}"
+    return labels
+
+
+def predict_best_algorithm(processes: List[Process], schedulers: List[IScheduler],
+                           sample_size: int = 2000, top_k: int = 2,
+                           criterion: str = "avg_waiting",
+                           seed: Optional[int] = 0) -> SelectionReport:
+    """
+    Selecciona el mejor algoritmo sin simular todos sobre la carga completa.
+    - Estima las métricas de cada algoritmo con una mini-simulación sobre ventanas muestreadas;
+      las estadísticas de la carga (`workload_stats`) dimensionan el calentamiento y el backlog.
+    - Solo simula por completo los `top_k` mejores según la estimación (menor `criterion`)
+      y elige entre ellos con `pick_best_algorithm`.
+    - Informa el error relativo entre lo estimado y lo real para los candidatos, y cuántos
+      procesos se midieron (`sample_size`) y simularon (`simulated`) en la muestra.
+    - Si la carga no supera `sample_size`, la "muestra" es la carga completa (error 0).
+    """
+    if not processes:
+        raise ValueError("La carga de trabajo está vacía.")
+    if sample_size <= 0:
+        raise ValueError("sample_size debe ser mayor a 0.")
+    if top_k <= 0:
+        raise ValueError("top_k debe ser mayor a 0.")
+    rng = random.Random(seed)
+    stats = workload_stats(processes)
+    samples = sample_workload(processes, sample_size, rng, stats=stats)
+    report = SelectionReport(stats=stats,
+                             sample_size=sum(window.measured for window in samples),
+                             simulated=sum(len(window.processes) for window in samples))
+    labeled = list(zip(scheduler_labels(schedulers), schedulers))
+    for label, s in labeled:
+        report.estimates[label] = _estimate(s, samples)
+
+    ranked = sorted(labeled, key=lambda item: report.estimates[item[0]][criterion])
+    for label, s in ranked[:top_k]:
+        if sample_size >= len(processes):
+            metrics = report.estimates[label]  # La muestra era la carga completa
+        else:
+            timeline, finalized = s.run(deep_reset(processes))
+            metrics = compute_system_metrics(finalized, timeline)
+        report.candidates.append(label)
+        report.actual[label] = metrics
+        real = metrics[criterion]
+        estimate = report.estimates[label][criterion]
+        report.errors[label] = abs(estimate - real) / real if real else abs(estimate - real)
+
+    report.best = pick_best_algorithm(report.actual, criterion)
+    return report
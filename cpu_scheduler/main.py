@@ -11,6 +11,11 @@ from utils.file_handler import load_named_set
 from utils.process_generator import manual_create_processes
 from ui.interface import run_simulation
 from core.algorithms.srtf import SRTF
+from core.algorithms.edf import EDF
+from core.algorithms.rate_monotonic import RateMonotonic
+from core.algorithms.lottery import LotteryScheduler
+from core.algorithms.stride import StrideScheduler
+from core.algorithms.cfs import CFS
 
 # Ruta absoluta al directorio raíz del proyecto
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -64,7 +69,7 @@ def select_process_source() -> List[Process]:
 
     if choice == "1":
         path = TESTS_PATH
-        print(Fore.MAGENTA + "\nConjuntos disponibles: set1, set2, set_personal (edítalo)." + Style.RESET_ALL)
+        print(Fore.MAGENTA + "\nConjuntos disponibles: set1, set2, set_personal (edítalo), set_tiempo_real." + Style.RESET_ALL)
         name = input("Nombre del conjunto (default: set1): ").strip() or "set1"
         try:
             processes = load_named_set(path, name)
@@ -94,9 +99,14 @@ def select_algorithms() -> List:
     print("3) Round Robin (configurable)")
     print("4) Prioridades (elige preemptivo/no preemptivo)")
     print("5) SRTF")
-    print("6) Ejecutar TODOS")
+    print("6) Ejecutar TODOS (clásicos + CFS)")
+    print("7) EDF (tiempo real, usa deadline/period)")
+    print("8) Rate Monotonic (tiempo real, usa period)")
+    print("9) Lotería (proporcional, tickets según prioridad)")
+    print("10) Stride (proporcional, tickets según prioridad)")
+    print("11) CFS (estilo Linux, prioridad = nice)")
 
-    sel = ask_until_valid(Fore.BLUE + "Elige [1-6] (default 5): "+ Style.RESET_ALL, ["1", "2", "3", "4", "5", "6"], "5")
+    sel = ask_until_valid(Fore.BLUE + "Elige [1-11] (default 5): "+ Style.RESET_ALL, ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"], "5")
 
     if sel == "1":
         return [FCFS()]
@@ -115,7 +125,22 @@ def select_algorithms() -> List:
         q = safe_int_input(Fore.BLUE + "Quantum para Round Robin (default 4): " + Style.RESET_ALL, 4, 1, 20 )
         pre_flag = ask_until_valid(Fore.BLUE + "Prioridades preemptivo? [s/n] (default s): " + Style.RESET_ALL, ["s", "n"], "s")
         preemptive = pre_flag == "s"
-        return [FCFS(), SJFNonPreemptive(), RoundRobin(quantum=q), PriorityScheduler(preemptive=preemptive), SRTF()]
+        return [FCFS(), SJFNonPreemptive(), RoundRobin(quantum=q), PriorityScheduler(preemptive=preemptive), SRTF(), CFS()]
+    elif sel == "7":
+        return [EDF()]
+    elif sel == "8":
+        return [RateMonotonic()]
+    elif sel == "9":
+        q = safe_int_input(Fore.BLUE + "Quantum (default 1): " + Style.RESET_ALL, 1, 1, 20)
+        seed = safe_int_input(Fore.BLUE + "Semilla aleatoria (default 42): " + Style.RESET_ALL, 42, 0, 10**9)
+        return [LotteryScheduler(quantum=q, seed=seed)]
+    elif sel == "10":
+        q = safe_int_input(Fore.BLUE + "Quantum (default 1): " + Style.RESET_ALL, 1, 1, 20)
+        return [StrideScheduler(quantum=q)]
+    elif sel == "11":
+        lat = safe_int_input(Fore.BLUE + "Latencia objetivo (default 12): " + Style.RESET_ALL, 12, 1, 100)
+        gran = safe_int_input(Fore.BLUE + "Granularidad mínima (default 2): " + Style.RESET_ALL, 2, 1, lat)
+        return [CFS(target_latency=lat, min_granularity=gran)]
 
 
 def main():
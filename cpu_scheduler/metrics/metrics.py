@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from typing import Dict, List
 from models.process import Process
 from core.timeline import Timeline
@@ -63,3 +64,124 @@ def compute_system_metrics(processes: List[Process], timeline: Timeline) -> Dict
         "avg_response": avg_response,
         "cpu_utilization": cpu_utilization,
     }
+
+
+def compute_deadline_metrics(processes: List[Process]) -> Dict[str, float]:
+    """
+    Calcula métricas de tiempo real para los procesos que tienen plazo (`deadline`).
+    - Lateness (retraso): finalización - plazo absoluto (negativo si terminó antes).
+    - Tardiness (tardanza): max(0, lateness).
+    - Pérdidas de plazo: cantidad de procesos con lateness > 0.
+    - Si ningún proceso tiene plazo, todas las métricas valen 0.
+    """
+    lateness = []
+    for p in processes:
+        if p.deadline is None:
+            continue
+        if p.completion_time is None:
+            raise ValueError(f"Proceso {p.id} sin tiempos completos.")
+        lateness.append(p.completion_time - p.absolute_deadline)
+
+    if not lateness:
+        return {"deadline_misses": 0, "miss_ratio": 0.0, "max_lateness": 0.0,
+                "avg_lateness": 0.0, "avg_tardiness": 0.0}
+
+    misses = sum(1 for l in lateness if l > 0)
+    return {
+        "deadline_misses": misses,
+        "miss_ratio": misses / len(lateness) * 100,
+        "max_lateness": max(lateness),
+        "avg_lateness": sum(lateness) / len(lateness),
+        "avg_tardiness": sum(max(0, l) for l in lateness) / len(lateness),
+    }
+
+
+def compute_share_metrics(processes: List[Process], timeline: Timeline,
+                          weights: Dict[str, float]) -> List[Dict[str, float]]:
+    """
+    Compara, por proceso, la CPU obtenida contra la que le corresponde según sus pesos (tickets).
+    - Mientras un proceso está en el sistema (llegada a finalización), cada unidad de CPU ocupada
+      se reparte entre los procesos presentes en proporción a sus pesos: eso es lo "merecido".
+    - Lo "obtenido" es su ráfaga completa; ratio = obtenido / merecido (1.0 = reparto exacto).
+    - Se calcula con un barrido de eventos: O(n log n).
+    """
+    # Tiempo ocupado acumulado hasta cada inicio de slot (para consultar la CPU ocupada en [a, b))
+    starts = [s.start for s in timeline.slots]
+    busy_before = [0]
+    for s in timeline.slots:
+        busy_before.append(busy_before[-1] + (s.end - s.start if s.process_id is not None else 0))
+
+    def busy_until(t: int) -> int:
+        i = bisect_right(starts, t) - 1
+        if i < 0:
+            return 0
+        s = timeline.slots[i]
+        partial = min(t, s.end) - s.start if s.process_id is not None else 0
+        return busy_before[i] + partial
+
+    # Eventos de entrada/salida de pesos; S(t) acumula CPU ocupada por unidad de peso
+    events = []
+    for p in processes:
+        if p.completion_time is None:
+            raise ValueError(f"Proceso {p.id} sin tiempos completos.")
+        w = weights[p.id]
+        events.append((p.arrival_time, w))
+        events.append((p.completion_time, -w))
+    events.sort()
+    share_at: Dict[int, float] = {}
+    active = 0.0
+    acc = 0.0
+    last = None
+    for t, dw in events:
+        if last is not None and t > last and active > 0:
+            acc += (busy_until(t) - busy_until(last)) / active
+        share_at[t] = acc
+        active += dw
+        last = t
+
+    rows = []
+    for p in processes:
+        entitled = weights[p.id] * (share_at[p.completion_time] - share_at[p.arrival_time])
+        rows.append({
+            "id": p.id,
+            "weight": weights[p.id],
+            "entitled": entitled,
+            "achieved": p.burst_time,
+            "ratio": p.burst_time / entitled if entitled > 0 else 0.0,
+        })
+    return rows
+
+
+def compute_fairness_metrics(processes: List[Process], timeline: Timeline,
+                             weights: Dict[str, float]) -> Dict[str, float]:
+    """
+    Resume la equidad del reparto proporcional de CPU.
+    - jain_fairness: índice de Jain sobre los ratios obtenido/merecido (1.0 = perfectamente justo).
+    - max_share_error / avg_share_error: desvío absoluto entre CPU obtenida y merecida.
+    """
+    rows = compute_share_metrics(processes, timeline, weights)
+    ratios = [r["ratio"] for r in rows]
+    sq = sum(x * x for x in ratios)
+    errors = [abs(r["achieved"] - r["entitled"]) for r in rows]
+    return {
+        "jain_fairness": (sum(ratios) ** 2) / (len(ratios) * sq) if sq > 0 else 1.0,
+        "max_share_error": max(errors),
+        "avg_share_error": sum(errors) / len(errors),
+    }
+
+
+def compute_scheduler_metrics(scheduler, processes: List[Process], timeline: Timeline) -> Dict[str, float]:
+    """
+    Calcula las métricas del sistema más las específicas del tipo de carga o de scheduler.
+    - Siempre incluye las de `compute_system_metrics`.
+    - Si algún proceso tiene plazo, agrega las de `compute_deadline_metrics`.
+    - Si el scheduler reparte por tickets (`tickets_for`), agrega las de `compute_fairness_metrics`.
+    """
+    metrics = compute_system_metrics(processes, timeline)
+    if any(p.deadline is not None for p in processes):
+        metrics.update(compute_deadline_metrics(processes))  # Cargas de tiempo real
+    if hasattr(scheduler, "tickets_for"):
+        # Schedulers proporcionales: CPU obtenida vs. merecida según tickets
+        weights = {p.id: scheduler.tickets_for(p) for p in processes}
+        metrics.update(compute_fairness_metrics(processes, timeline, weights))
+    return metrics
@@ -1,31 +1,58 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from enum import IntEnum
+from itertools import repeat
+from typing import List, Optional, Sequence
 
-@dataclass(order=True)
+
+class ProcessState(IntEnum):
+    """
+    Estados posibles de un proceso durante la simulación.
+    - Es un IntEnum: cada estado es un entero compartido en lugar de una cadena,
+      y sigue pudiendo compararse y guardarse como número.
+    - `label` devuelve el nombre legible en español (para mostrar en pantalla).
+    """
+    NUEVO = 0
+    LISTO = 1
+    EJECUTANDO = 2
+    TERMINADO = 3
+
+    @property
+    def label(self) -> str:
+        """Nombre legible del estado (ejemplo: "Ejecutando")."""
+        return self.name.capitalize()
+
+
+@dataclass(slots=True)
 class Process:
     """
     Clase que representa un proceso en el sistema de planificación de CPU.
     - Se utiliza en los algoritmos de scheduling para simular la ejecución de procesos.
     - Incluye atributos básicos (id, llegada, ráfaga, prioridad) y métricas calculadas durante la simulación.
-    - El decorador @dataclass con `order=True` permite comparar procesos por sus atributos
-      (útil en algoritmos como SJF o SRTF).
+    - Usa `slots=True`: sin `__dict__` por instancia, cada proceso ocupa bastante menos memoria
+      y el acceso a los atributos es más rápido. No se generan métodos de orden: los algoritmos
+      ordenan siempre con claves explícitas (llegada, ID, ráfaga, ...).
     """
     id: str                          # Identificador único del proceso (ejemplo: "P1")
     arrival_time: int                # Tiempo en que el proceso llega al sistema
     burst_time: int                  # Tiempo total de ejecución requerido (ráfaga)
     priority: int = 0                # Nivel de prioridad (menor valor = mayor prioridad)
-    state: str = field(default="Nuevo", compare=False)  
-    # Estado del proceso (ejemplo: "Nuevo", "Ejecutando", "Finalizado").
-    # No se usa para comparación entre procesos.
+    state: ProcessState = field(default=ProcessState.NUEVO, compare=False)
+    # Estado del proceso (ver `ProcessState`). No se usa para comparación entre procesos.
 
     # Campos de métricas (se calculan durante la simulación)
-    start_time: Optional[int] = field(default=None, compare=False)   
+    start_time: Optional[int] = field(default=None, compare=False)
     # Momento en que el proceso comienza a ejecutarse por primera vez
-    completion_time: Optional[int] = field(default=None, compare=False)  
+    completion_time: Optional[int] = field(default=None, compare=False)
     # Momento en que el proceso finaliza su ejecución
-    remaining_time: Optional[int] = field(default=None, compare=False)  
+    remaining_time: Optional[int] = field(default=None, compare=False)
     # Tiempo restante de ejecución (usado en algoritmos apropiativos como SRTF)
 
+    # Campos de tiempo real (opcionales; usados por EDF y Rate Monotonic)
+    deadline: Optional[int] = field(default=None, compare=False)
+    # Plazo relativo a la llegada: el proceso debería terminar antes de arrival_time + deadline
+    period: Optional[int] = field(default=None, compare=False)
+    # Período de una tarea periódica: se libera un nuevo trabajo cada `period` unidades
+
     def __post_init__(self):
         """
         Método especial de dataclass que se ejecuta después de la inicialización.
@@ -35,14 +62,37 @@ class Process:
         if self.remaining_time is None:
             self.remaining_time = self.burst_time
 
+    @classmethod
+    def from_columns(cls, ids: Sequence[str], arrivals: Sequence[int], bursts: Sequence[int],
+                     priorities: Optional[Sequence[int]] = None) -> List["Process"]:
+        """
+        Construye muchos procesos a partir de columnas paralelas (una secuencia por atributo).
+        - Es la forma más barata de crear cargas grandes: no arma un diccionario por fila
+          y llama al constructor por posición mediante `map` (sin argumentos por nombre).
+        - `priorities` es opcional (0 para todos si no se indica).
+        - Las columnas deben tener el mismo largo.
+        """
+        columns = (ids, arrivals, bursts) if priorities is None else (ids, arrivals, bursts, priorities)
+        if any(len(col) != len(ids) for col in columns):
+            raise ValueError("Las columnas deben tener la misma cantidad de elementos.")
+        return list(map(cls, ids, arrivals, bursts, repeat(0) if priorities is None else priorities))
+
+    @property
+    def absolute_deadline(self) -> Optional[int]:
+        """
+        Devuelve el instante límite absoluto del proceso (llegada + plazo relativo).
+        - Si el proceso no tiene plazo, devuelve None.
+        """
+        return None if self.deadline is None else self.arrival_time + self.deadline
+
     def reset_runtime(self):
         """
         Reinicia el estado del proceso para permitir nuevas simulaciones.
-        - Restablece el estado a "Nuevo".
+        - Restablece el estado a NUEVO.
         - Borra tiempos de inicio y finalización.
         - Reinicia el tiempo restante con el valor original de ráfaga.
         """
-        self.state = "Nuevo"
+        self.state = ProcessState.NUEVO
         self.start_time = None
         self.completion_time = None
         self.remaining_time = self.burst_time
@@ -0,0 +1,341 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+from core.scheduler import build_scheduler, pick_best_algorithm
+from metrics.metrics import compute_per_process_metrics, compute_scheduler_metrics
+from utils.file_handler import processes_from_rows
+
+# Cantidad de slots del timeline enviados por cada escritura al socket
+SLOT_BATCH = 512
+
+# Tiempo máximo (segundos) de ejecución de una simulación antes de interrumpirla
+DEFAULT_JOB_TIMEOUT = 60.0
+
+# Margen (segundos) para que el worker informe la interrupción antes de apartar su pool
+JOB_TIMEOUT_GRACE = 5.0
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+
+class RequestError(Exception):
+    """Error de una petición HTTP que se responde al cliente con el código indicado."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class JobTimeout(RuntimeError):
+    """Se lanza dentro del worker cuando una simulación excede su límite de tiempo."""
+
+
+def _on_alarm(signum, frame):
+    raise JobTimeout()
+
+
+def simulate_job(rows: List[Dict[str, Any]], spec: Dict[str, Any],
+                 time_limit: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Ejecuta un algoritmo sobre una carga de trabajo (se llama dentro de un proceso del pool).
+    - `rows`: procesos con el formato de `tests/cases.json`.
+    - `spec`: {"name": ..., parámetros...}, ver `core.scheduler.build_scheduler`.
+    - `time_limit`: segundos de ejecución permitidos; si la plataforma tiene SIGALRM, el propio
+      worker interrumpe la simulación con JobTimeout y queda libre para el siguiente trabajo.
+    - Devuelve datos serializables: slots del timeline, métricas por proceso y del sistema.
+    """
+    alarm = time_limit is not None and hasattr(signal, "setitimer")
+    if alarm:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, time_limit)
+    try:
+        params = {k: v for k, v in spec.items() if k != "name"}
+        scheduler = build_scheduler(spec["name"], **params)
+        timeline, finalized = scheduler.run(processes_from_rows(rows))
+        metrics = compute_scheduler_metrics(scheduler, finalized, timeline)
+        return {
+            "algorithm": scheduler.name,
+            "slots": [[s.process_id, s.start, s.end] for s in timeline.slots],
+            "per_process": compute_per_process_metrics(finalized),
+            "metrics": metrics,
+        }
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+class SimulationServer:
+    """
+    Servicio HTTP/JSON local (asyncio) para ejecutar simulaciones de forma programática.
+    - POST /simulate: recibe {"processes": [...], "algorithms": [{"name": "rr", "quantum": 4}, ...]}
+      y responde en streaming (NDJSON, chunked) los slots y métricas de cada algoritmo a medida
+      que terminan, seguidos de una línea final con el mejor algoritmo.
+    - GET /health: estado del servicio y cantidad de trabajos en curso.
+    - Las simulaciones corren en un pool acotado de procesos con los schedulers existentes.
+    - Contrapresión: si hay `max_pending` peticiones en curso, se responde 503 con Retry-After;
+      además, cada escritura espera a que el cliente consuma los datos (`drain`).
+    - Cada simulación tiene un límite de `job_timeout` segundos de ejecución (el tiempo en cola
+      no cuenta): si se excede, el worker la interrumpe y se informa el error en el stream;
+      los trabajos de otras peticiones no se ven afectados. Si un worker muere, el pool
+      se reemplaza por uno nuevo.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, workers: int = 2,
+                 max_pending: int = 8, max_body: int = 16 * 1024 * 1024,
+                 job_timeout: float = DEFAULT_JOB_TIMEOUT):
+        if workers <= 0 or max_pending <= 0:
+            raise ValueError("workers y max_pending deben ser mayores a 0.")
+        if job_timeout <= 0:
+            raise ValueError("job_timeout debe ser mayor a 0.")
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_body = max_body
+        self.job_timeout = job_timeout
+        self.pending = 0
+        # Trabajos enviados al pool como máximo (uno por worker): así ninguno espera en la cola
+        # interna del pool y el límite de tiempo mide solo la ejecución
+        self._slots = asyncio.Semaphore(workers)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        """Crea el pool de procesos y empieza a escuchar en `host:port`."""
+        self._pool = self._new_pool()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Si se pidió el puerto 0, se publica el puerto real asignado por el sistema
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """Crea el pool de simulación."""
+        # "spawn": los workers no heredan los sockets de las conexiones abiertas (como con fork)
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   mp_context=multiprocessing.get_context("spawn"))
+
+    def _replace_pool(self, pool: ProcessPoolExecutor):
+        """
+        Reemplaza un pool roto o con un worker que no responde por uno nuevo.
+        - Solo actúa si `pool` sigue siendo el pool actual (otra petición pudo reemplazarlo ya).
+        - El pool viejo se cierra sin cancelar lo que ya está en ejecución: los trabajos de otras
+          peticiones terminan normalmente y sus workers salen al quedar libres.
+        """
+        if pool is not self._pool:
+            return
+        pool.shutdown(wait=False)
+        self._pool = self._new_pool()
+
+    async def serve_forever(self):
+        """Inicia el servidor (si hace falta) y atiende peticiones hasta ser cancelado."""
+        if self._server is None:
+            await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Detiene el servidor y libera el pool de procesos."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atiende una conexión: una petición por conexión (Connection: close)."""
+        try:
+            try:
+                method, path, body = await self._read_request(reader)
+                if path == "/health":
+                    if method != "GET":
+                        raise RequestError(405, "Método no permitido.")
+                    await self._send_json(writer, 200, {"status": "ok", "pending": self.pending})
+                elif path == "/simulate":
+                    if method != "POST":
+                        raise RequestError(405, "Método no permitido.")
+                    await self._simulate(writer, body)
+                else:
+                    raise RequestError(404, f"Ruta desconocida: {path}")
+            except RequestError as e:
+                await self._send_json(writer, e.status, {"error": str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # El cliente cerró la conexión
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        """Lee la línea de petición, las cabeceras y el cuerpo (según Content-Length)."""
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            raise RequestError(400, "Línea de petición inválida.")
+        method, path, _ = parts
+        headers: Dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise RequestError(400, "Content-Length inválido.")
+        if length > self.max_body:
+            raise RequestError(413, "Carga de trabajo demasiado grande.")
+        body = await reader.readexactly(length) if length > 0 else b""
+        return method.upper(), path.split("?", 1)[0], body
+
+    @staticmethod
+    def _parse_simulation(body: bytes) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Valida el cuerpo de /simulate antes de ocupar el pool (RequestError 400 si es inválido).
+        - Construye los procesos y los schedulers una vez para detectar valores inválidos
+          (ráfagas no positivas, llegadas negativas, algoritmos o parámetros desconocidos).
+        """
+        try:
+            payload = json.loads(body or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError("el cuerpo debe ser un objeto JSON")
+            rows = payload["processes"]
+            specs = payload.get("algorithms") or [{"name": "fcfs"}]
+            if not isinstance(rows, list) or not isinstance(specs, list):
+                raise ValueError('"processes" y "algorithms" deben ser listas')
+            processes_from_rows(rows)
+            for spec in specs:
+                if not isinstance(spec, dict):
+                    raise ValueError('cada algoritmo debe ser un objeto con "name"')
+                params = {k: v for k, v in spec.items() if k != "name"}
+                build_scheduler(spec["name"], **params)
+        except (ValueError, KeyError, TypeError) as e:
+            raise RequestError(400, f"Petición inválida: {e}")
+        if not rows:
+            raise RequestError(400, "La carga de trabajo está vacía.")
+        return rows, specs
+
+    async def _run_job(self, rows: List[Dict[str, Any]], spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Ejecuta un trabajo en el pool con límite de tiempo y devuelve su resultado.
+        - Espera un worker libre antes de enviarlo, de modo que el tiempo en cola no cuenta.
+        - Si excede `job_timeout`, el worker lo interrumpe (JobTimeout) y se lanza RuntimeError.
+          Si además el worker no responde dentro de `JOB_TIMEOUT_GRACE` (o no hay SIGALRM),
+          se aparta su pool sin terminar los trabajos en curso de otras peticiones.
+        - Si el pool está roto (un worker murió), se reemplaza y el trabajo se reintenta una vez
+          (`simulate_job` no tiene efectos secundarios).
+        """
+        expired = f"La simulación excedió el límite de {self.job_timeout:g} s."
+        for _ in range(2):
+            async with self._slots:
+                pool = self._pool
+                try:
+                    future = pool.submit(simulate_job, rows, spec, self.job_timeout)
+                except BrokenProcessPool:
+                    self._replace_pool(pool)
+                    continue
+                try:
+                    return await asyncio.wait_for(asyncio.wrap_future(future),
+                                                  self.job_timeout + JOB_TIMEOUT_GRACE)
+                except JobTimeout:
+                    raise RuntimeError(expired)
+                except asyncio.TimeoutError:
+                    self._replace_pool(pool)
+                    raise RuntimeError(expired)
+                except BrokenProcessPool:
+                    self._replace_pool(pool)
+        raise RuntimeError("Un worker de simulación terminó inesperadamente.")
+
+    async def _simulate(self, writer: asyncio.StreamWriter, body: bytes):
+        """Valida la petición, encola un trabajo por algoritmo y transmite los resultados."""
+        if self.pending >= self.max_pending:
+            raise RequestError(503, "Servidor ocupado, reintente más tarde.")
+        rows, specs = self._parse_simulation(body)
+
+        waiters: List[asyncio.Task] = []
+        self.pending += 1
+        try:
+            waiters = [asyncio.ensure_future(self._run_job(rows, spec)) for spec in specs]
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                         b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+            comparison: Dict[str, Dict[str, float]] = {}
+            for done in asyncio.as_completed(waiters):
+                try:
+                    result = await done
+                except Exception as e:
+                    await self._send_chunk(writer, [{"type": "error", "error": str(e)}])
+                    continue
+                algo = result["algorithm"]
+                slots = result["slots"]
+                for i in range(0, len(slots), SLOT_BATCH):
+                    await self._send_chunk(writer, [
+                        {"type": "slot", "algorithm": algo, "process_id": pid, "start": start, "end": end}
+                        for pid, start, end in slots[i:i + SLOT_BATCH]
+                    ])
+                await self._send_chunk(writer, [{
+                    "type": "metrics", "algorithm": algo,
+                    "per_process": result["per_process"], "system": result["metrics"],
+                }])
+                comparison[algo] = result["metrics"]
+            best = pick_best_algorithm(comparison) if comparison else None
+            await self._send_chunk(writer, [{"type": "done", "best": best}])
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        finally:
+            for waiter in waiters:
+                waiter.cancel()  # Si el cliente se desconecta, se descartan los trabajos no iniciados
+            self.pending -= 1
+
+    @staticmethod
+    async def _send_chunk(writer: asyncio.StreamWriter, lines: List[Dict[str, Any]]):
+        """Envía un chunk HTTP con varias líneas NDJSON y espera a que el cliente lo consuma."""
+        data = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines).encode("utf-8")
+        writer.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        await writer.drain()
+
+    @staticmethod
+    async def _send_json(writer: asyncio.StreamWriter, status: int, data: Dict[str, Any]):
+        """Envía una respuesta JSON completa (no streaming)."""
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write((head + "\r\n").encode("ascii") + body)
+        await writer.drain()
+
+
+def main():
+    """Punto de entrada: `python -m service.server --port 8765` desde `cpu_scheduler/`."""
+    parser = argparse.ArgumentParser(description="Servicio local de simulación de planificación de CPU")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección de escucha (default: loopback)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=2, help="Procesos del pool de simulación")
+    parser.add_argument("--max-pending", type=int, default=8, help="Peticiones simultáneas admitidas")
+    parser.add_argument("--job-timeout", type=float, default=DEFAULT_JOB_TIMEOUT,
+                        help="Segundos máximos por simulación")
+    args = parser.parse_args()
+
+    server = SimulationServer(args.host, args.port, args.workers, args.max_pending,
+                              job_timeout=args.job_timeout)
+    print(f"Escuchando en http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
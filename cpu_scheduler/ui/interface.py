@@ -1,45 +1,92 @@
 from colorama import *
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
 from models.process import Process
 from core.scheduler import IScheduler, deep_reset, pick_best_algorithm
-from metrics.metrics import compute_per_process_metrics, compute_system_metrics
+from core.profiling import SchedulerProfile
+from core.approximate import ApproximateResult, approximate_simulation
+from utils.result_cache import ResultCache
+from metrics.metrics import compute_per_process_metrics, compute_scheduler_metrics
 from ui.results_display import (
     print_gantt,
     print_process_metrics,
     print_system_metrics,
     print_comparison_table,
+    print_profile,
+    print_approximate_comparison,
 )
 
-def run_simulation(processes: List[Process], schedulers: List[IScheduler]):
+def run_simulation(processes: List[Process], schedulers: List[IScheduler],
+                   profile: bool = False,
+                   cache: Optional[ResultCache] = None) -> Dict[str, Dict[str, Any]]:
     """
     Función principal para ejecutar la simulación de planificación de CPU.
     - Recibe una lista de procesos y una lista de algoritmos de planificación (schedulers).
     - Ejecuta cada algoritmo sobre la misma carga de trabajo.
     - Muestra resultados individuales (Gantt, métricas por proceso, métricas del sistema).
     - Compara los algoritmos y selecciona automáticamente el mejor según el tiempo de espera promedio.
+    - Si `profile=True`, instrumenta los schedulers que lo admiten (atributo `profiler`)
+      y muestra sus contadores; para el resto solo indica que no están instrumentados.
+    - Si se pasa un `cache`, reutiliza resultados previos de la misma carga y configuración
+      (la instrumentación solo se registra cuando el algoritmo se ejecuta realmente);
+      los schedulers no reproducibles (Lotería sin semilla) se simulan siempre.
+    - Devuelve, por algoritmo, el timeline, las métricas y (si aplica) el perfil.
     """
     # Diccionario para almacenar métricas comparativas de cada algoritmo
     comparison: Dict[str, Dict[str, float]] = {}
+    results: Dict[str, Dict[str, Any]] = {}
 
     # Itera sobre cada algoritmo seleccionado
     for s in schedulers:
         print(Fore.YELLOW + f"\n=== Ejecutando {s.name} ===" + Style.RESET_ALL)
-        # Se reinicia el estado de los procesos antes de ejecutar cada algoritmo
-        timeline, finalized = s.run(deep_reset(processes))
+        key = cache.key_for(processes, s) if cache is not None else None
+        cached = cache.get(key) if key is not None else None
+        prof = None
 
-        # Muestra el diagrama de Gantt (orden de ejecución de procesos en el tiempo)
-        print_gantt(timeline)
+        if cached is not None:
+            # Acierto de caché: se reutilizan timeline y métricas sin simular
+            timeline, per, metrics = cached
+            print_gantt(timeline)
+            print_process_metrics(per)
+            print_system_metrics(metrics)
+        else:
+            # Solo se instrumentan los schedulers que declaran `profiler` (SRTF, Prioridades, RR):
+            # en los demás los contadores quedarían en cero
+            instrumented = hasattr(s, "profiler")
+            prof = SchedulerProfile() if profile and instrumented else None
+            if instrumented:
+                s.profiler = prof
+            # Se reinicia el estado de los procesos antes de ejecutar cada algoritmo
+            timeline, finalized = s.run(deep_reset(processes))
+            if prof is not None:
+                t0 = prof.clock()
 
-        # Calcula métricas por proceso (tiempo de espera, tiempo de retorno, etc.)
-        per = compute_per_process_metrics(finalized)
-        print_process_metrics(per)
+            # Muestra el diagrama de Gantt (orden de ejecución de procesos en el tiempo)
+            print_gantt(timeline)
 
-        # Calcula métricas globales del sistema (promedios, utilización, etc.)
-        metrics = compute_system_metrics(finalized, timeline)
-        print_system_metrics(metrics)
+            # Calcula métricas por proceso (tiempo de espera, tiempo de retorno, etc.)
+            per = compute_per_process_metrics(finalized)
+            print_process_metrics(per)
+
+            # Calcula métricas globales del sistema (promedios, utilización, etc.)
+            metrics = compute_scheduler_metrics(s, finalized, timeline)
+            print_system_metrics(metrics)
+
+            if prof is not None:
+                prof.add_time("metrics", prof.clock() - t0)
+                print_profile(prof.to_dict())
+            elif profile:
+                print(Fore.CYAN + "\nPerfil de ejecución:" + Style.RESET_ALL + f" {s.name} no está instrumentado.")
+            if key is not None:
+                cache.put(key, timeline, per, metrics)
 
         # Almacena las métricas en el diccionario de comparación
         comparison[s.name] = metrics
+        results[s.name] = {
+            "timeline": timeline,
+            "per_process": per,
+            "metrics": metrics,
+            "profile": prof.to_dict() if prof is not None else None,
+        }
 
     # Muestra tabla comparativa de resultados entre algoritmos
     print_comparison_table(comparison)
@@ -47,3 +94,23 @@ def run_simulation(processes: List[Process], schedulers: List[IScheduler]):
     # Selecciona automáticamente el mejor algoritmo según menor tiempo de espera promedio
     best = pick_best_algorithm(comparison)
     print(Fore.LIGHTMAGENTA_EX + f"\nConclusión automática: mejor algoritmo para este caso (menor espera promedio) => {best}" + Style.RESET_ALL)
+
+    return results
+
+
+def run_approximate_simulation(processes: List[Process], schedulers: List[IScheduler],
+                               sample_periods: int = 200, workers: Optional[int] = None,
+                               seed: Optional[int] = 0) -> Dict[str, ApproximateResult]:
+    """
+    Variante exploratoria de `run_simulation` para trazas enormes.
+    - Cada algoritmo se simula solo sobre una muestra de períodos ocupados (en paralelo)
+      y sus métricas se extrapolan con márgenes de error.
+    - No muestra Gantt ni métricas por proceso; imprime la tabla comparativa aproximada.
+    """
+    results: Dict[str, ApproximateResult] = {}
+    for s in schedulers:
+        results[s.name] = approximate_simulation(processes, s, sample_periods, workers, seed=seed)
+    print_approximate_comparison(results)
+    best = min(results.items(), key=lambda kv: kv[1].metrics["avg_waiting"])[0]
+    print(Fore.LIGHTMAGENTA_EX + f"\nConclusión aproximada (menor espera promedio estimada) => {best}" + Style.RESET_ALL)
+    return results
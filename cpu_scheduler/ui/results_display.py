@@ -42,12 +42,27 @@ def print_system_metrics(metrics: Dict[str, float]):
         • avg_waiting: tiempo promedio de espera
         • avg_response: tiempo promedio de respuesta
         • cpu_utilization: porcentaje de utilización de CPU
+        • deadline_misses, miss_ratio, max_lateness, avg_lateness, avg_tardiness
+          (opcionales, solo para cargas con plazos)
+        • jain_fairness, max_share_error, avg_share_error
+          (opcionales, solo para schedulers proporcionales)
     """
     print(Fore.CYAN + "\nMétricas del sistema:" + Style.RESET_ALL)
     print(f"- Promedio Turnaround: {metrics['avg_turnaround']:.2f}")
     print(f"- Promedio Espera:     {metrics['avg_waiting']:.2f}")
     print(f"- Promedio Respuesta:  {metrics['avg_response']:.2f}")
     print(f"- Utilización CPU:     {metrics['cpu_utilization']:.2f}%")
+    if "deadline_misses" in metrics:
+        # Métricas de tiempo real (solo si la carga tiene plazos)
+        print(f"- Plazos perdidos:     {metrics['deadline_misses']} ({metrics['miss_ratio']:.2f}%)")
+        print(f"- Retraso máximo:      {metrics['max_lateness']:.2f}")
+        print(f"- Retraso promedio:    {metrics['avg_lateness']:.2f}")
+        print(f"- Tardanza promedio:   {metrics['avg_tardiness']:.2f}")
+    if "jain_fairness" in metrics:
+        # Métricas de reparto proporcional (solo para schedulers con tickets)
+        print(f"- Índice de Jain:      {metrics['jain_fairness']:.4f}")
+        print(f"- Desvío máx. reparto: {metrics['max_share_error']:.2f}")
+        print(f"- Desvío prom. reparto:{metrics['avg_share_error']:.2f}")
 
 
 def print_comparison_table(results: Dict[str, Dict[str, float]]):
@@ -63,3 +78,37 @@ def print_comparison_table(results: Dict[str, Dict[str, float]]):
     for algo, m in results.items():
         # Se imprimen métricas promedio con dos decimales
         print(f"{algo} | {m['avg_turnaround']:.2f} | {m['avg_waiting']:.2f} | {m['avg_response']:.2f} | {m['cpu_utilization']:.2f}")
+
+
+def print_profile(profile: Dict[str, float]):
+    """
+    Imprime los contadores de instrumentación de un scheduler.
+    - Recibe el diccionario generado por `SchedulerProfile.to_dict()`.
+    - Los tiempos por fase (claves `time_*`) se muestran en milisegundos.
+    """
+    print(Fore.CYAN + "\nPerfil de ejecución:" + Style.RESET_ALL)
+    for key, value in profile.items():
+        if key.startswith("time_"):
+            print(f"- {key}: {value * 1000:.3f} ms")
+        elif isinstance(value, float):
+            print(f"- {key}: {value:.2f}")
+        else:
+            print(f"- {key}: {value}")
+
+
+def print_approximate_comparison(results: Dict[str, "ApproximateResult"]):
+    """
+    Imprime la tabla comparativa del modo aproximado, con el margen de error de cada métrica.
+    - Recibe un diccionario algoritmo -> `ApproximateResult` (ver `core.approximate`).
+    - Marca con * los algoritmos con estado entre períodos (`stateful`).
+    """
+    print(Fore.GREEN + "\nComparación aproximada (muestra de períodos ocupados):" + Style.RESET_ALL)
+    header = ["Algoritmo", "Avg Turnaround", "Avg Espera", "Avg Respuesta", "CPU Util (%)", "Períodos"]
+    print(" | ".join(header))
+    for algo, r in results.items():
+        m, e = r.metrics, r.error_bounds
+        print(f"{algo} | {m['avg_turnaround']:.2f} ± {e['avg_turnaround']:.2f} | {m['avg_waiting']:.2f} ± {e['avg_waiting']:.2f}"
+              f" | {m['avg_response']:.2f} ± {e['avg_response']:.2f} | {m['cpu_utilization']:.2f}"
+              f" | {r.periods_sampled}/{r.periods_total}{' *' if r.stateful else ''}")
+    if any(r.stateful for r in results.values()):
+        print("* Algoritmo con estado entre períodos ocupados: estimación aproximada, sesgo no incluido en el margen.")
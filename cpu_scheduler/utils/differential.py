@@ -0,0 +1,278 @@
+import argparse
+import copy
+import random
+import tempfile
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from models.process import Process
+from core.timeline import Timeline
+from core.scheduler import IScheduler, deep_reset
+from core.profiling import SchedulerProfile
+from core.parallel import SUPPORTED as PARALLEL_SUPPORTED, parallel_run
+from core.incremental import CheckpointedSimulation
+from core.algorithms.fcfs import FCFS
+from core.algorithms.sjf import SJFNonPreemptive
+from core.algorithms.round_robin import RoundRobin
+from core.algorithms.priority import PriorityScheduler
+from core.algorithms.srtf import SRTF
+from metrics.metrics import compute_per_process_metrics
+from utils.result_cache import ResultCache, is_reproducible
+
+# Fila de una carga de trabajo: (id, llegada, ráfaga, prioridad)
+Row = Tuple[str, int, int, int]
+
+# Resultado comparable de una ejecución: slots (pid, inicio, fin) y métricas por proceso
+Snapshot = Tuple[List[Tuple[Optional[str], int, int]], List[Dict[str, float]]]
+
+
+@dataclass
+class Engine:
+    """
+    Motor alternativo que debe reproducir exactamente a los schedulers de referencia.
+    - run: recibe el scheduler de referencia y la carga, devuelve (timeline, métricas por proceso).
+    - supports: indica si el motor admite ese scheduler.
+    """
+    name: str
+    run: Callable[[IScheduler, List[Process]], Tuple[Timeline, List[Dict[str, float]]]]
+    supports: Callable[[IScheduler], bool]
+
+
+@dataclass
+class Mismatch:
+    """
+    Diferencia encontrada entre un motor y la referencia.
+    - rows: carga mínima (ya reducida) que reproduce la diferencia.
+    - original_size: cantidad de procesos de la carga aleatoria que la reveló.
+    """
+    scheduler: str
+    engine: str
+    detail: str
+    rows: List[Row]
+    original_size: int
+
+
+def build_processes(rows: Sequence[Row]) -> List[Process]:
+    """Construye los procesos de una carga expresada como filas."""
+    return [Process(pid, arrival, burst, priority) for pid, arrival, burst, priority in rows]
+
+
+def random_workload(rng: random.Random, max_size: int = 10, huge_burst: int = 2000) -> List[Row]:
+    """
+    Genera una carga aleatoria pensada para encontrar casos borde.
+    - Empates: varios procesos con la misma llegada (y a veces la misma ráfaga o prioridad).
+    - Huecos cero: llegadas justo en el instante en que la CPU termina todo lo pendiente.
+    - Ráfagas enormes ocasionales (hasta `huge_burst`) junto a ráfagas de 1.
+    - El orden de las filas se mezcla: algunos algoritmos desempatan por orden de entrada.
+    """
+    n = rng.randint(1, max_size)
+    rows: List[Row] = []
+    arrival = 0
+    finish = 0  # Instante en que se vaciaría la CPU con lo generado hasta ahora
+    for i in range(n):
+        roll = rng.random()
+        if roll < 0.25 and rows:
+            pass  # Empate con la llegada anterior
+        elif roll < 0.45:
+            arrival = max(arrival, finish)  # Hueco cero respecto del trabajo pendiente
+        else:
+            arrival += rng.choice((0, 1, 2, 3, 5, 8, 20))
+        burst = rng.randint(huge_burst // 2, huge_burst) if rng.random() < 0.05 else rng.randint(1, 6)
+        rows.append((f"P{i + 1}", arrival, burst, rng.randint(0, 3)))
+        finish = max(finish, arrival) + burst
+    rng.shuffle(rows)
+    return rows
+
+
+def _reference(scheduler: IScheduler, processes: List[Process]) -> Tuple[Timeline, List[Dict[str, float]]]:
+    timeline, finalized = scheduler.run(deep_reset(processes))
+    return timeline, compute_per_process_metrics(finalized)
+
+
+def _parallel(scheduler: IScheduler, processes: List[Process]):
+    # Un solo worker: segmenta y une en el proceso actual (la lógica a validar es la misma)
+    timeline, finalized = parallel_run(scheduler, processes, workers=1)
+    return timeline, compute_per_process_metrics(finalized)
+
+
+def _incremental(scheduler: IScheduler, processes: List[Process]):
+    timeline, finalized = CheckpointedSimulation(scheduler, processes, interval=2).result()
+    return timeline, compute_per_process_metrics(finalized)
+
+
+def _incremental_edit(scheduler: IScheduler, processes: List[Process]):
+    # Se simula una carga alterada y luego se edita el proceso para volver a la original
+    edited = deep_reset(processes)
+    target = edited[0]
+    target.arrival_time += 3
+    target.burst_time += 5
+    target.reset_runtime()
+    sim = CheckpointedSimulation(scheduler, edited, interval=2)
+    original = processes[0]
+    sim.update(original.id, arrival_time=original.arrival_time,
+               burst_time=original.burst_time, priority=original.priority)
+    timeline, finalized = sim.result()
+    return timeline, compute_per_process_metrics(finalized)
+
+
+def _cache_roundtrip(scheduler: IScheduler, processes: List[Process]):
+    # Guarda el resultado de referencia en un caché vacío y lo vuelve a leer
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResultCache(directory)
+        key = cache.key_for(processes, scheduler)
+        timeline, per = _reference(scheduler, processes)
+        cache.put(key, timeline, per, {})
+        cached = cache.get(key)
+    if cached is None:
+        raise RuntimeError("La entrada recién guardada no está en el caché.")
+    return cached[0], cached[1]
+
+
+def _profiled(scheduler: IScheduler, processes: List[Process]):
+    # La instrumentación no debe alterar las decisiones del algoritmo
+    instrumented = copy.copy(scheduler)
+    instrumented.profiler = SchedulerProfile()
+    return _reference(instrumented, processes)
+
+
+def _untracked(scheduler: IScheduler, processes: List[Process]):
+    # El modo sin registro de estados tampoco debe alterar las decisiones
+    light = copy.copy(scheduler)
+    light.track_state = False
+    return _reference(light, processes)
+
+
+ENGINES: List[Engine] = [
+    Engine("paralelo", _parallel, lambda s: isinstance(s, PARALLEL_SUPPORTED)),
+    Engine("incremental", _incremental, lambda s: isinstance(s, CheckpointedSimulation.SUPPORTED)),
+    Engine("incremental (edición)", _incremental_edit,
+           lambda s: isinstance(s, CheckpointedSimulation.SUPPORTED)),
+    Engine("caché", _cache_roundtrip, is_reproducible),
+    Engine("perfilado", _profiled, lambda s: hasattr(s, "profiler")),
+    Engine("sin estados", _untracked, lambda s: hasattr(s, "track_state")),
+]
+
+
+def default_schedulers() -> List[IScheduler]:
+    """Schedulers de referencia cubiertos por el arnés (con sus variantes de configuración)."""
+    return [FCFS(), SJFNonPreemptive(), RoundRobin(quantum=1), RoundRobin(quantum=3),
+            PriorityScheduler(preemptive=True), PriorityScheduler(preemptive=False), SRTF()]
+
+
+def compare_snapshots(expected: Snapshot, actual: Snapshot) -> Optional[str]:
+    """
+    Compara dos resultados de forma exacta.
+    - Devuelve la descripción de la primera diferencia, o None si son idénticos.
+    """
+    exp_slots, exp_per = expected
+    act_slots, act_per = actual
+    for k, (a, b) in enumerate(zip(exp_slots, act_slots)):
+        if a != b:
+            return f"slot {k}: esperado {a}, obtenido {b}"
+    if len(exp_slots) != len(act_slots):
+        return f"cantidad de slots: esperado {len(exp_slots)}, obtenido {len(act_slots)}"
+    for k, (a, b) in enumerate(zip(exp_per, act_per)):
+        if a != b:
+            return f"proceso {k}: esperado {a}, obtenido {b}"
+    if len(exp_per) != len(act_per):
+        return f"cantidad de procesos: esperado {len(exp_per)}, obtenido {len(act_per)}"
+    return None
+
+
+def _snapshot(result: Tuple[Timeline, List[Dict[str, float]]]) -> Snapshot:
+    timeline, per = result
+    return [(s.process_id, s.start, s.end) for s in timeline.slots], list(per)
+
+
+def check_case(scheduler: IScheduler, engine: Engine, rows: Sequence[Row]) -> Optional[str]:
+    """
+    Ejecuta la referencia y el motor sobre una carga y devuelve la diferencia (o None).
+    - Una excepción del motor también cuenta como diferencia.
+    """
+    processes = build_processes(rows)
+    expected = _snapshot(_reference(scheduler, processes))
+    try:
+        actual = _snapshot(engine.run(scheduler, processes))
+    except Exception as exc:  # El motor falló donde la referencia no
+        return f"excepción {type(exc).__name__}: {exc}"
+    return compare_snapshots(expected, actual)
+
+
+def shrink(rows: List[Row], fails: Callable[[List[Row]], bool]) -> List[Row]:
+    """
+    Reduce una carga que falla a una mínima que sigue fallando (minimización voraz).
+    - Primero intenta quitar procesos; luego simplifica valores (llegadas hacia 0,
+      ráfagas hacia 1, prioridades a 0) hasta que ningún paso mantenga la falla.
+    """
+    def candidates(current: List[Row]):
+        for i in range(len(current)):
+            if len(current) > 1:
+                yield current[:i] + current[i + 1:]
+        for i, (pid, arrival, burst, priority) in enumerate(current):
+            simpler = [(pid, 0, burst, priority), (pid, arrival // 2, burst, priority),
+                       (pid, arrival - 1, burst, priority), (pid, arrival, 1, priority),
+                       (pid, arrival, burst // 2, priority), (pid, arrival, burst - 1, priority),
+                       (pid, arrival, burst, 0)]
+            for row in simpler:
+                if row != current[i] and row[1] >= 0 and row[2] >= 1:
+                    yield current[:i] + [row] + current[i + 1:]
+
+    improved = True
+    while improved:
+        improved = False
+        for candidate in candidates(rows):
+            if fails(candidate):
+                rows = candidate
+                improved = True
+                break
+    return rows
+
+
+def run_differential(trials: int = 200, seed: Optional[int] = 0, max_size: int = 10,
+                     huge_burst: int = 2000, schedulers: Optional[List[IScheduler]] = None,
+                     engines: Optional[List[Engine]] = None) -> List[Mismatch]:
+    """
+    Compara todos los motores contra las referencias sobre `trials` cargas aleatorias.
+    - Cada diferencia se reduce a una carga mínima; se informa a lo sumo una por
+      combinación (scheduler, motor), para no repetir la misma falla.
+    """
+    rng = random.Random(seed)
+    schedulers = default_schedulers() if schedulers is None else schedulers
+    engines = ENGINES if engines is None else engines
+    mismatches: List[Mismatch] = []
+    reported = set()
+    for _ in range(trials):
+        rows = random_workload(rng, max_size, huge_burst)
+        for k, s in enumerate(schedulers):
+            for engine in engines:
+                pair = (k, engine.name)
+                if pair in reported or not engine.supports(s):
+                    continue
+                if check_case(s, engine, rows) is None:
+                    continue
+                minimal = shrink(rows, lambda r: check_case(s, engine, r) is not None)
+                mismatches.append(Mismatch(s.name, engine.name, check_case(s, engine, minimal),
+                                           minimal, len(rows)))
+                reported.add(pair)
+    return mismatches
+
+
+def main(argv: List[str] = None):
+    """Punto de entrada: `python -m utils.differential --trials 500` desde `cpu_scheduler/`."""
+    parser = argparse.ArgumentParser(description="Validación diferencial de motores contra los schedulers de referencia")
+    parser.add_argument("--trials", type=int, default=200, help="Cantidad de cargas aleatorias")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-size", type=int, default=10, help="Procesos por carga (máximo)")
+    args = parser.parse_args(argv)
+
+    mismatches = run_differential(args.trials, args.seed, args.max_size)
+    if not mismatches:
+        print(f"Sin diferencias en {args.trials} cargas.")
+        return 0
+    for m in mismatches:
+        print(f"[{m.scheduler} / {m.engine}] {m.detail}")
+        print(f"  carga mínima ({len(m.rows)} de {m.original_size} procesos): {m.rows}")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,197 @@
+import os
+import tempfile
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+from models.process import Process
+from core.timeline import GanttSlot, Timeline
+
+# Dependencias opcionales: pyarrow (Parquet / Arrow IPC) o, en su defecto, NumPy (.npz)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Procesos por bloque: acota la memoria usada durante la exportación
+DEFAULT_CHUNK_SIZE = 65_536
+
+# Columnas de cada tabla: (nombre, tipo) con tipo "str" o "int"
+PROCESS_COLUMNS = (("id", "str"), ("arrival", "int"), ("burst", "int"), ("priority", "int"),
+                   ("start", "int"), ("completion", "int"), ("turnaround", "int"),
+                   ("waiting", "int"), ("response", "int"))
+TIMELINE_COLUMNS = (("process_id", "str"), ("start", "int"), ("end", "int"))
+
+FORMATS = ("parquet", "arrow", "npz")
+_EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow", "npz": ".npz"}
+
+Columns = Sequence[Tuple[str, str]]
+
+
+def available_format() -> str:
+    """
+    Devuelve el formato que se usa con `fmt="auto"`: Parquet si hay pyarrow, si no `.npz`.
+    - Lanza ImportError con un mensaje claro si no está ninguna de las dos dependencias.
+    """
+    if pa is not None:
+        return "parquet"
+    if np is not None:
+        return "npz"
+    raise ImportError("Para exportar resultados se requiere pyarrow (Parquet / Arrow IPC) "
+                      "o numpy (.npz): instale alguno con `pip install pyarrow` o `pip install numpy`.")
+
+
+def _resolve_format(fmt: str) -> str:
+    """Valida el formato pedido y comprueba que su dependencia esté instalada."""
+    if fmt == "auto":
+        return available_format()
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato desconocido: {fmt}. Opciones: auto, {', '.join(FORMATS)}")
+    if fmt in ("parquet", "arrow") and pa is None:
+        raise ImportError(f"El formato {fmt} requiere pyarrow (`pip install pyarrow`).")
+    if fmt == "npz" and np is None:
+        raise ImportError("El formato npz requiere numpy (`pip install numpy`).")
+    return fmt
+
+
+def _process_row(item: Union[Process, Dict[str, Any]]) -> tuple:
+    """
+    Convierte un proceso finalizado (o una fila de `compute_per_process_metrics`) en una fila.
+    - Calcula las métricas al vuelo para no materializar la lista completa de diccionarios.
+    """
+    if isinstance(item, dict):
+        return tuple(item[name] for name, _ in PROCESS_COLUMNS)
+    if item.completion_time is None or item.start_time is None:
+        raise ValueError(f"Proceso {item.id} sin tiempos completos.")
+    turnaround = item.completion_time - item.arrival_time
+    return (item.id, item.arrival_time, item.burst_time, item.priority, item.start_time,
+            item.completion_time, turnaround, turnaround - item.burst_time,
+            item.start_time - item.arrival_time)
+
+
+def _slot_row(slot: GanttSlot) -> tuple:
+    """Fila de un slot del Gantt; los slots idle tienen `process_id` vacío."""
+    return ("" if slot.process_id is None else slot.process_id, slot.start, slot.end)
+
+
+def _chunks(rows: Iterable[tuple], width: int, chunk_size: int) -> Iterator[List[list]]:
+    """Agrupa filas en bloques de a lo sumo `chunk_size`, ya transpuestos por columna."""
+    columns: List[list] = [[] for _ in range(width)]
+    count = 0
+    for row in rows:
+        for col, value in zip(columns, row):
+            col.append(value)
+        count += 1
+        if count == chunk_size:
+            yield columns
+            columns = [[] for _ in range(width)]
+            count = 0
+    if count:
+        yield columns
+
+
+def _write_arrow(path: str, fmt: str, columns: Columns, chunks: Iterator[List[list]]) -> int:
+    """Escribe los bloques como row groups de Parquet o record batches de Arrow IPC."""
+    schema = pa.schema([(name, pa.string() if kind == "str" else pa.int64()) for name, kind in columns])
+    writer = pq.ParquetWriter(path, schema) if fmt == "parquet" else pa.ipc.new_file(path, schema)
+    rows = 0
+    try:
+        for chunk in chunks:
+            writer.write_batch(pa.record_batch(chunk, schema=schema))
+            rows += len(chunk[0])
+    finally:
+        writer.close()
+    return rows
+
+
+def _write_npz(path: str, columns: Columns, chunks: Iterator[List[list]]) -> int:
+    """
+    Escribe un `.npz` (un `.npy` por columna dentro de un zip) bloque a bloque.
+    - El encabezado de cada `.npy` necesita el largo total y el ancho máximo de los textos,
+      que solo se conocen al final: los bloques se vuelcan primero a archivos temporales
+      (uno por columna) y luego se copian al zip con el tipo definitivo.
+    - El costo es lineal y en memoria solo hay un bloque a la vez.
+    """
+    rows = 0
+    str_width = {name: 1 for name, kind in columns if kind == "str"}
+    with tempfile.TemporaryDirectory() as tmp:
+        spools = {name: open(os.path.join(tmp, f"{name}.spool"), "w+b") for name, _ in columns}
+        try:
+            for chunk in chunks:
+                for (name, kind), values in zip(columns, chunk):
+                    arr = np.asarray(values, dtype=str if kind == "str" else np.int64)
+                    if kind == "str":
+                        str_width[name] = max(str_width[name], arr.dtype.itemsize // 4)
+                    np.save(spools[name], arr, allow_pickle=False)
+                rows += len(chunk[0])
+
+            with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+                for name, kind in columns:
+                    dtype = np.dtype(f"<U{str_width[name]}") if kind == "str" else np.dtype(np.int64)
+                    spool = spools[name]
+                    end = spool.tell()
+                    spool.seek(0)
+                    with zf.open(f"{name}.npy", "w", force_zip64=True) as member:
+                        np.lib.format.write_array_header_1_0(
+                            member, {"descr": np.lib.format.dtype_to_descr(dtype),
+                                     "fortran_order": False, "shape": (rows,)})
+                        while spool.tell() < end:
+                            member.write(np.load(spool, allow_pickle=False).astype(dtype).tobytes())
+        finally:
+            for spool in spools.values():
+                spool.close()
+    return rows
+
+
+def _export(path: str, columns: Columns, rows: Iterable[tuple], fmt: str, chunk_size: int) -> int:
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser mayor a 0.")
+    chunks = _chunks(rows, len(columns), chunk_size)
+    if fmt == "npz":
+        return _write_npz(path, columns, chunks)
+    return _write_arrow(path, fmt, columns, chunks)
+
+
+def export_process_metrics(path: str, processes: Iterable[Union[Process, Dict[str, Any]]],
+                           fmt: str = "auto", chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Exporta las métricas por proceso en formato columnar, por bloques.
+    - `processes` puede ser cualquier iterable de procesos finalizados o de filas de
+      `compute_per_process_metrics` (por ejemplo, las de una entrada del caché).
+    - Columnas: id, arrival, burst, priority, start, completion, turnaround, waiting, response.
+    - Devuelve la cantidad de filas escritas.
+    """
+    return _export(path, PROCESS_COLUMNS, map(_process_row, processes), _resolve_format(fmt), chunk_size)
+
+
+def export_timeline(path: str, slots: Union[Timeline, Iterable[GanttSlot]],
+                    fmt: str = "auto", chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Exporta los slots del diagrama de Gantt (process_id, start, end) en formato columnar.
+    - Los períodos idle se exportan con `process_id` vacío.
+    - Devuelve la cantidad de filas escritas.
+    """
+    if isinstance(slots, Timeline):
+        slots = slots.slots
+    return _export(path, TIMELINE_COLUMNS, map(_slot_row, slots), _resolve_format(fmt), chunk_size)
+
+
+def export_results(base_path: str, timeline: Timeline,
+                   processes: Iterable[Union[Process, Dict[str, Any]]],
+                   fmt: str = "auto", chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, str]:
+    """
+    Exporta el resultado de un algoritmo en dos archivos junto a `base_path`:
+        • `<base>_procesos.<ext>`: métricas por proceso.
+        • `<base>_timeline.<ext>`: slots del diagrama de Gantt.
+    - Con `fmt="auto"` usa Parquet si pyarrow está instalado y `.npz` (NumPy) si no.
+    - Devuelve las rutas escritas por tabla.
+    """
+    fmt = _resolve_format(fmt)
+    ext = _EXTENSIONS[fmt]
+    paths = {"procesos": f"{base_path}_procesos{ext}", "timeline": f"{base_path}_timeline{ext}"}
+    export_process_metrics(paths["procesos"], processes, fmt, chunk_size)
+    export_timeline(paths["timeline"], timeline, fmt, chunk_size)
+    return paths
@@ -1,7 +1,51 @@
 import json
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional
 from models.process import Process
 
+
+def _optional_int(value: Any) -> Optional[int]:
+    """Convierte a entero un valor opcional del JSON (None se mantiene)."""
+    return None if value is None else int(value)
+
+
+def _process_from_row(item: Dict[str, Any]) -> Process:
+    """
+    Construye un `Process` a partir de una fila, validando sus valores.
+    - Aplica las mismas reglas que la carga manual (`manual_create_processes`):
+      llegada >= 0, ráfaga > 0 y prioridad >= 0; además, si hay período, debe ser > 0.
+    - Una ráfaga de 0 o un período no positivo harían que algunos algoritmos no terminen,
+      por eso se rechazan con ValueError antes de simular.
+    """
+    process = Process(
+        id=item["id"],  # Identificador del proceso
+        arrival_time=int(item["arrival"]),  # Tiempo de llegada
+        burst_time=int(item["burst"]),  # Tiempo de ráfaga (ejecución)
+        priority=int(item.get("priority", 0)),  # Prioridad (por defecto 0 si no está en JSON)
+        deadline=_optional_int(item.get("deadline")),  # Plazo relativo (tiempo real)
+        period=_optional_int(item.get("period")),  # Período (tareas periódicas)
+    )
+    if process.arrival_time < 0:
+        raise ValueError(f"Proceso {process.id}: el tiempo de llegada no puede ser negativo.")
+    if process.burst_time <= 0:
+        raise ValueError(f"Proceso {process.id}: el tiempo de ráfaga debe ser un entero positivo.")
+    if process.priority < 0:
+        raise ValueError(f"Proceso {process.id}: la prioridad debe ser un entero no negativo.")
+    if process.period is not None and process.period <= 0:
+        raise ValueError(f"Proceso {process.id}: el período debe ser un entero positivo.")
+    return process
+
+
+def processes_from_rows(rows: Iterable[Dict[str, Any]]) -> List[Process]:
+    """
+    Construye objetos `Process` a partir de filas con el formato del archivo JSON.
+    - Cada fila debe tener "id", "arrival" y "burst"; "priority" es opcional (default 0).
+    - Para tiempo real se admiten además "deadline" (plazo relativo) y "period" (opcionales).
+    - Valida cada fila (ver `_process_from_row`): los valores inválidos lanzan ValueError.
+    - Se usa tanto al cargar archivos como al recibir cargas de trabajo por otras vías (API).
+    """
+    return [_process_from_row(item) for item in rows]
+
+
 def load_processes_from_json(path: str) -> List[Process]:
     """
     Función principal para cargar procesos desde un archivo JSON.
@@ -23,16 +67,8 @@ def load_processes_from_json(path: str) -> List[Process]:
     first_key = next(iter(sets), None)
     if not first_key:
         return []  # Si no hay conjuntos, devuelve lista vacía
-    return [
-        # Se crea un objeto Process por cada entrada en el conjunto
-        Process(
-            id=item["id"],  # Identificador del proceso
-            arrival_time=int(item["arrival"]),  # Tiempo de llegada
-            burst_time=int(item["burst"]),  # Tiempo de ráfaga (ejecución)
-            priority=int(item.get("priority", 0))  # Prioridad (por defecto 0 si no está en JSON)
-        )
-        for item in sets[first_key]
-    ]
+    # Se crea un objeto Process por cada entrada en el conjunto
+    return processes_from_rows(sets[first_key])
 
 
 def load_named_set(path: str, name: str) -> List[Process]:
@@ -44,13 +80,5 @@ def load_named_set(path: str, name: str) -> List[Process]:
     with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)  # Carga el archivo JSON
     arr = data.get("sets", {}).get(name, [])  # Obtiene el conjunto por nombre
-    return [
-        # Se construye la lista de procesos a partir del conjunto solicitado
-        Process(
-            id=item["id"],  # Identificador único del proceso
-            arrival_time=int(item["arrival"]),  # Tiempo de llegada
-            burst_time=int(item["burst"]),  # Duración de ejecución
-            priority=int(item.get("priority", 0))  # Nivel de prioridad (default 0)
-        )
-        for item in arr
-    ]
+    # Se construye la lista de procesos a partir del conjunto solicitado
+    return processes_from_rows(arr)
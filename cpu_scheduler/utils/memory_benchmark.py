@@ -0,0 +1,104 @@
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+from models.process import Process
+from core.scheduler import deep_reset
+from core.algorithms.fcfs import FCFS
+
+
+class _DictRecord:
+    """
+    Registro equivalente a `Process` pero con `__dict__` por instancia.
+    - Reproduce la disposición anterior del modelo, solo como referencia de comparación.
+    """
+    def __init__(self, id, arrival_time, burst_time, priority=0):
+        self.id = id
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.state = "Nuevo"
+        self.start_time = None
+        self.completion_time = None
+        self.remaining_time = burst_time
+        self.deadline = None
+        self.period = None
+
+
+def _columns(n: int):
+    """Columnas sintéticas de una carga de `n` procesos (IDs distintos, llegadas crecientes)."""
+    ids = [f"P{i}" for i in range(n)]
+    arrivals = list(range(0, 2 * n, 2))
+    bursts = [1 + i % 7 for i in range(n)]
+    priorities = [i % 5 for i in range(n)]
+    return ids, arrivals, bursts, priorities
+
+
+def measure_bytes(build: Callable[[], list], n: int) -> float:
+    """
+    Mide con tracemalloc la memoria retenida por lo que construye `build`, por elemento.
+    - Las columnas de entrada se crean antes de empezar a medir, así que no se cuentan.
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        records = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del records
+    return (after - before) / n
+
+
+def memory_per_process(n: int = 100_000) -> Dict[str, float]:
+    """
+    Compara los bytes por proceso de las distintas representaciones de una carga.
+    - "Process (slots)": el modelo actual, construido con `Process.from_columns`.
+    - "Registro con __dict__": la misma información con un diccionario de atributos por instancia.
+    - "Fila dict (JSON)": el formato de las filas leídas desde archivo o recibidas por la API.
+    """
+    ids, arrivals, bursts, priorities = _columns(n)
+    return {
+        "Process (slots)": measure_bytes(
+            lambda: Process.from_columns(ids, arrivals, bursts, priorities), n),
+        "Registro con __dict__": measure_bytes(
+            lambda: [_DictRecord(*row) for row in zip(ids, arrivals, bursts, priorities)], n),
+        "Fila dict (JSON)": measure_bytes(
+            lambda: [{"id": i, "arrival": a, "burst": b, "priority": p}
+                     for i, a, b, p in zip(ids, arrivals, bursts, priorities)], n),
+    }
+
+
+def state_tracking_cost(n: int = 100_000) -> Dict[str, float]:
+    """
+    Mide el tiempo (segundos) de FCFS sobre `n` procesos con y sin registro de estados.
+    """
+    processes = Process.from_columns(*_columns(n))
+    timings: Dict[str, float] = {}
+    for track in (True, False):
+        scheduler = FCFS()
+        scheduler.track_state = track
+        procs = deep_reset(processes)
+        start = time.perf_counter()
+        scheduler.run(procs)
+        timings["con estados" if track else "sin estados"] = time.perf_counter() - start
+    return timings
+
+
+def main(argv: List[str] = None):
+    """Punto de entrada: `python -m utils.memory_benchmark -n 100000` desde `cpu_scheduler/`."""
+    parser = argparse.ArgumentParser(description="Memoria por proceso de las representaciones de carga")
+    parser.add_argument("-n", type=int, default=100_000, help="Cantidad de procesos a construir")
+    args = parser.parse_args(argv)
+
+    print(f"Memoria por proceso ({args.n} procesos):")
+    for label, size in memory_per_process(args.n).items():
+        print(f"  {label:<24} {size:8.1f} bytes")
+    print("FCFS con/sin registro de estados:")
+    for label, seconds in state_tracking_cost(args.n).items():
+        print(f"  {label:<24} {seconds:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import hashlib
+import inspect
+import json
+import os
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+from models.process import Process
+from core.timeline import Timeline
+
+# Versión del formato de las entradas; cambiarla invalida todo el caché existente
+CACHE_FORMAT_VERSION = 1
+
+# Atributos del scheduler que no forman parte de su configuración
+_IGNORED_ATTRS = {"name", "profiler", "track_state"}
+
+# Raíz del código del simulador (cpu_scheduler/): solo sus módulos forman la versión del código
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def workload_fingerprint(processes: List[Process]) -> str:
+    """
+    Calcula una huella (SHA-256) de la carga de trabajo.
+    - Solo considera las columnas de entrada (id, llegada, ráfaga, prioridad, plazo, período),
+      en el orden recibido, ignorando el estado de ejecución de los procesos.
+    """
+    h = hashlib.sha256()
+    for p in processes:
+        h.update(f"{p.id}\x1f{p.arrival_time}\x1f{p.burst_time}\x1f{p.priority}"
+                 f"\x1f{p.deadline}\x1f{p.period}\x1e".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _is_scheduler(value) -> bool:
+    """Indica si un valor se comporta como un scheduler (tiene `run` y `name`)."""
+    return hasattr(value, "run") and hasattr(value, "name")
+
+
+def project_modules(module: ModuleType) -> List[ModuleType]:
+    """
+    Devuelve `module` y los módulos del proyecto de los que depende, transitivamente.
+    - Sigue lo que cada módulo importa (módulos, clases y funciones de sus globales),
+      descartando la biblioteca estándar y las dependencias externas
+      (`module` se incluye siempre, aunque esté fuera del proyecto).
+    - Por ejemplo, EDF incluye core/realtime.py, y todos incluyen core/timeline.py y models/process.py.
+    """
+    found: Dict[str, ModuleType] = {}
+    pending = [module]
+    while pending:
+        mod = pending.pop()
+        if mod is None or mod.__name__ in found:
+            continue
+        path = getattr(mod, "__file__", None)
+        inside = path is not None and os.path.abspath(path).startswith(_PROJECT_ROOT + os.sep)
+        if mod is not module and not inside:
+            continue
+        found[mod.__name__] = mod
+        for value in vars(mod).values():
+            pending.append(value if inspect.ismodule(value) else inspect.getmodule(value))
+    return [found[name] for name in sorted(found)]
+
+
+def _code_version(cls) -> str:
+    """Hash del fuente de los módulos del proyecto de los que depende la clase."""
+    module = inspect.getmodule(cls)
+    if module is None:
+        return hashlib.sha256(cls.__qualname__.encode("utf-8")).hexdigest()  # Solo el nombre de la clase
+    h = hashlib.sha256()
+    for mod in project_modules(module):
+        try:
+            source = inspect.getsource(mod)
+        except (OSError, TypeError):
+            source = ""  # Sin fuente disponible: solo cuenta el nombre del módulo
+        h.update(f"{mod.__name__}\x1f{source}\x1e".encode("utf-8"))
+    return h.hexdigest()
+
+
+def scheduler_fingerprint(scheduler) -> str:
+    """
+    Calcula una huella del scheduler: nombre, parámetros y versión del código.
+    - Los parámetros son los atributos públicos de la instancia (quantum, preemptive, ...);
+      si alguno es a su vez un scheduler, se usa su propia huella.
+    - La versión del código es el hash del fuente del módulo donde se define la clase y de
+      los módulos del proyecto que usa (ver `project_modules`), de modo que cualquier cambio
+      en el algoritmo o en lo que comparte con otros (timeline, modelo, ...) invalida sus entradas.
+    """
+    params = {k: v for k, v in sorted(vars(scheduler).items())
+              if k not in _IGNORED_ATTRS and not k.startswith("_")}
+    for k, v in params.items():
+        if _is_scheduler(v):
+            params[k] = scheduler_fingerprint(v)  # Scheduler envuelto (por ejemplo, ParallelScheduler)
+    payload = json.dumps({
+        "class": type(scheduler).__qualname__,
+        "name": scheduler.name,
+        "params": params,
+        "code": _code_version(type(scheduler)),
+        "format": CACHE_FORMAT_VERSION,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_reproducible(scheduler) -> bool:
+    """
+    Indica si el resultado del scheduler depende solo de la carga y su configuración.
+    - Un scheduler puede declararse no reproducible con `reproducible = False`
+      (por ejemplo, Lotería sin semilla); los que envuelve otro también cuentan.
+    """
+    if not getattr(scheduler, "reproducible", True):
+        return False
+    return all(is_reproducible(v) for v in vars(scheduler).values() if _is_scheduler(v))
+
+
+class ResultCache:
+    """
+    Caché en disco de resultados de simulación, direccionado por contenido.
+    - La clave combina la huella de la carga de trabajo y la del scheduler.
+    - Cada entrada es un archivo JSON con el timeline, las métricas por proceso y las del sistema.
+    - Desalojo LRU por tamaño: al superar `max_bytes` se eliminan las entradas
+      usadas hace más tiempo (según su fecha de modificación, que se actualiza en cada acierto).
+    """
+    def __init__(self, directory: str, max_bytes: int = 64 * 1024 * 1024):
+        if max_bytes <= 0:
+            raise ValueError("El tamaño máximo del caché debe ser mayor a 0.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key_for(self, processes: List[Process], scheduler) -> Optional[str]:
+        """
+        Devuelve la clave de caché para una carga de trabajo y un scheduler.
+        - Devuelve None si el scheduler no es reproducible: su resultado no debe cachearse.
+        """
+        if not is_reproducible(scheduler):
+            return None
+        combined = workload_fingerprint(processes) + scheduler_fingerprint(scheduler)
+        return hashlib.sha256(combined.encode("ascii")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Tuple[Timeline, List[Dict[str, float]], Dict[str, float]]]:
+        """
+        Busca una entrada en el caché.
+        - Devuelve (timeline, métricas por proceso, métricas del sistema) o None si no existe.
+        - Las entradas corruptas se eliminan y se tratan como fallos.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)  # Marca la entrada como usada recientemente (LRU)
+        except FileNotFoundError:
+            pass  # Otro proceso la desalojó después de leerla: el contenido leído sigue siendo válido
+        timeline = Timeline()
+        for pid, start, end in data["slots"]:
+            timeline.add_slot(pid, start, end)
+        return timeline, data["per_process"], data["metrics"]
+
+    def put(self, key: str, timeline: Timeline, per_process: List[Dict[str, float]],
+            metrics: Dict[str, float]):
+        """
+        Guarda una entrada en el caché y aplica el desalojo por tamaño.
+        - La escritura es atómica (archivo temporal + reemplazo).
+        """
+        data: Dict[str, Any] = {
+            "slots": [[s.process_id, s.start, s.end] for s in timeline.slots],
+            "per_process": per_process,
+            "metrics": metrics,
+        }
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self):
+        """Elimina las entradas menos usadas hasta que el caché quepa en `max_bytes`."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".json"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+        entries.sort()  # Más antiguas primero
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """Vacía el caché por completo."""
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".json"):
+                self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Los módulos del simulador se importan relativos a cpu_scheduler/ (igual que desde main.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cpu_scheduler"))
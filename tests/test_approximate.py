@@ -0,0 +1,72 @@
+import random
+import pytest
+from models.process import Process
+from core.scheduler import deep_reset
+from core.approximate import approximate_simulation
+from core.algorithms.fcfs import FCFS
+from core.algorithms.sjf import SJFNonPreemptive
+from core.algorithms.srtf import SRTF
+from core.algorithms.priority import PriorityScheduler
+from core.algorithms.cfs import CFS
+from metrics.metrics import compute_scheduler_metrics
+
+METRICS = ("avg_turnaround", "avg_waiting", "avg_response", "cpu_utilization")
+
+
+def workload(n, load=0.7, seed=1):
+    # Llegadas de Poisson con ráfagas de media 5: con load < 1 hay muchos períodos ocupados
+    rng = random.Random(seed)
+    t = 0.0
+    processes = []
+    for i in range(n):
+        t += rng.expovariate(load / 5)
+        processes.append(Process(f"P{i}", int(t), rng.randint(1, 9), rng.randint(0, 4)))
+    return processes
+
+
+def full_metrics(scheduler, processes):
+    timeline, finalized = scheduler.run(deep_reset(processes))
+    return compute_scheduler_metrics(scheduler, finalized, timeline)
+
+
+SCHEDULERS = [FCFS(), SJFNonPreemptive(), SRTF(), PriorityScheduler(True), PriorityScheduler(False)]
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS, ids=lambda s: f"{s.name}")
+def test_exact_mode_matches_run_simulation(scheduler):
+    pytest.importorskip("colorama")
+    from ui.interface import run_simulation
+    processes = workload(400)
+    result = approximate_simulation(processes, scheduler, sample_periods=10_000, workers=1)
+    expected = run_simulation(processes, [scheduler])[scheduler.name]["metrics"]
+    for key in METRICS:
+        assert result.metrics[key] == pytest.approx(expected[key], abs=1e-9)
+        assert result.error_bounds[key] == 0.0
+
+
+@pytest.mark.parametrize("scheduler", SCHEDULERS + [CFS()], ids=lambda s: f"{s.name}")
+def test_exact_mode_matches_full_run(scheduler):
+    processes = workload(400)
+    result = approximate_simulation(processes, scheduler, sample_periods=10_000, workers=1)
+    expected = full_metrics(scheduler, processes)
+    for key in METRICS:
+        assert result.metrics[key] == pytest.approx(expected[key], abs=1e-9)
+        assert result.error_bounds[key] == 0.0
+    assert not result.stateful
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sampled_estimate_within_reported_bounds(seed):
+    processes = workload(6000, seed=seed + 10)
+    result = approximate_simulation(processes, FCFS(), sample_periods=300, workers=1, seed=seed)
+    expected = full_metrics(FCFS(), processes)
+    assert result.periods_sampled < result.periods_total
+    for key in ("avg_turnaround", "avg_waiting", "avg_response"):
+        assert abs(result.metrics[key] - expected[key]) <= result.error_bounds[key]
+    assert result.metrics["cpu_utilization"] == pytest.approx(expected["cpu_utilization"])
+
+
+def test_sampled_stateful_scheduler_is_flagged():
+    processes = workload(2000)
+    assert approximate_simulation(processes, CFS(), sample_periods=50, workers=1).stateful
+    assert not approximate_simulation(processes, FCFS(), sample_periods=50, workers=1).stateful
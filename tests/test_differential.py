@@ -0,0 +1,55 @@
+import random
+from utils.differential import (
+    Engine,
+    build_processes,
+    check_case,
+    random_workload,
+    run_differential,
+    shrink,
+)
+from core.parallel import parallel_run
+from core.scheduler import deep_reset
+from core.algorithms.fcfs import FCFS
+from core.algorithms.srtf import SRTF
+from metrics.metrics import compute_per_process_metrics
+
+
+def test_engines_match_reference():
+    # Todas las combinaciones (scheduler, motor) deben coincidir exactamente
+    mismatches = run_differential(trials=150, seed=1234)
+    assert not mismatches, "\n".join(f"{m.scheduler} / {m.engine}: {m.detail} -> {m.rows}" for m in mismatches)
+
+
+def test_parallel_pool_matches_serial():
+    # Mismo chequeo que el motor "paralelo", pero repartiendo los períodos en un pool real
+    rng = random.Random(7)
+    rows = [row for _ in range(30) for row in random_workload(rng, max_size=8, huge_burst=50)]
+    rows = [(f"P{k}", arrival + 100 * k, burst, priority) for k, (_, arrival, burst, priority) in enumerate(rows)]
+    processes = build_processes(rows)
+    for scheduler in (FCFS(), SRTF()):
+        expected_timeline, expected = scheduler.run(deep_reset(processes))
+        timeline, actual = parallel_run(scheduler, processes, workers=2)
+        assert timeline.slots == expected_timeline.slots
+        assert [(p.id, p.start_time, p.completion_time) for p in actual] == \
+               [(p.id, p.start_time, p.completion_time) for p in expected]
+
+
+def test_detects_and_shrinks_divergence():
+    # Un motor defectuoso (pierde el último slot) se detecta y se reduce a un solo proceso
+    def broken(scheduler, processes):
+        timeline, finalized = scheduler.run(deep_reset(processes))
+        timeline.slots.pop()
+        return timeline, compute_per_process_metrics(finalized)
+
+    engine = Engine("roto", broken, lambda s: True)
+    mismatches = run_differential(trials=5, seed=3, schedulers=[FCFS()], engines=[engine])
+    assert len(mismatches) == 1
+    assert len(mismatches[0].rows) == 1
+    assert mismatches[0].rows[0][1:3] == (0, 1)  # Llegada 0, ráfaga 1
+    assert check_case(FCFS(), engine, mismatches[0].rows) is not None
+
+
+def test_shrink_keeps_failure():
+    rows = [("P1", 9, 40, 2), ("P2", 3, 7, 1), ("P3", 12, 2, 3)]
+    minimal = shrink(rows, lambda r: any(burst >= 5 for _, _, burst, _ in r))
+    assert minimal == [("P2", 0, 5, 0)]
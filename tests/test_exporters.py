@@ -0,0 +1,150 @@
+import pytest
+import utils.exporters as ex
+from models.process import Process
+from core.timeline import Timeline
+from core.algorithms.fcfs import FCFS
+
+# IDs no ASCII y de ancho variable: el ancho de los textos crece entre bloques
+IDS = ["P1", "ñandú", "プロセス-7", "x", "proceso-muy-largo-con-acentos-áéí", "Ω"]
+
+
+def finished_processes():
+    # Llegadas espaciadas: quedan huecos idle entre procesos
+    processes = [Process(pid, 6 * i, 1 + i % 3, i % 2) for i, pid in enumerate(IDS)]
+    timeline, finalized = FCFS().run(processes)
+    return timeline, finalized
+
+
+def expected_process_rows(finalized):
+    return [ex._process_row(p) for p in finalized]
+
+
+def expected_slot_rows(timeline):
+    return [ex._slot_row(s) for s in timeline.slots]
+
+
+def read_npz(path, columns):
+    np = pytest.importorskip("numpy")
+    with np.load(path, allow_pickle=False) as data:
+        cols = [data[name].tolist() for name, _ in columns]
+    return [tuple(row) for row in zip(*cols)] if cols[0] else []
+
+
+def read_arrow(path, fmt):
+    pa = pytest.importorskip("pyarrow")
+    if fmt == "parquet":
+        table = pytest.importorskip("pyarrow.parquet").read_table(path)
+    else:
+        with pa.ipc.open_file(path) as reader:
+            table = reader.read_all()
+    return [tuple(row.values()) for row in table.to_pylist()], table
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_npz_round_trip(tmp_path, chunk_size):
+    pytest.importorskip("numpy")
+    timeline, finalized = finished_processes()
+    assert any(s.process_id is None for s in timeline.slots)
+
+    path = str(tmp_path / "procesos.npz")
+    assert ex.export_process_metrics(path, finalized, "npz", chunk_size) == len(IDS)
+    assert read_npz(path, ex.PROCESS_COLUMNS) == expected_process_rows(finalized)
+
+    path = str(tmp_path / "timeline.npz")
+    assert ex.export_timeline(path, timeline, "npz", chunk_size) == len(timeline.slots)
+    assert read_npz(path, ex.TIMELINE_COLUMNS) == expected_slot_rows(timeline)
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_arrow_round_trip(tmp_path, fmt, chunk_size):
+    pytest.importorskip("pyarrow")
+    timeline, finalized = finished_processes()
+
+    path = str(tmp_path / f"procesos.{fmt}")
+    assert ex.export_process_metrics(path, finalized, fmt, chunk_size) == len(IDS)
+    rows, _ = read_arrow(path, fmt)
+    assert rows == expected_process_rows(finalized)
+
+    path = str(tmp_path / f"timeline.{fmt}")
+    assert ex.export_timeline(path, timeline, fmt, chunk_size) == len(timeline.slots)
+    rows, _ = read_arrow(path, fmt)
+    assert rows == expected_slot_rows(timeline)
+    assert ("", 1, 6) in rows  # Hueco idle con process_id vacío
+
+
+def test_rows_from_metric_dicts_match_processes(tmp_path):
+    pytest.importorskip("numpy")
+    from metrics.metrics import compute_per_process_metrics
+    _, finalized = finished_processes()
+    path = str(tmp_path / "dicts.npz")
+    ex.export_process_metrics(path, compute_per_process_metrics(finalized), "npz", 2)
+    assert read_npz(path, ex.PROCESS_COLUMNS) == expected_process_rows(finalized)
+
+
+@pytest.mark.parametrize("fmt", ["npz", "parquet", "arrow"])
+def test_empty_tables(tmp_path, fmt):
+    pytest.importorskip("numpy" if fmt == "npz" else "pyarrow")
+    path = str(tmp_path / f"vacio.{fmt}")
+    assert ex.export_timeline(path, Timeline(), fmt) == 0
+    if fmt == "npz":
+        assert read_npz(path, ex.TIMELINE_COLUMNS) == []
+    else:
+        rows, table = read_arrow(path, fmt)
+        assert rows == [] and table.column_names == [name for name, _ in ex.TIMELINE_COLUMNS]
+
+
+def test_export_results_uses_available_format(tmp_path):
+    pytest.importorskip("numpy")
+    timeline, finalized = finished_processes()
+    paths = ex.export_results(str(tmp_path / "fcfs"), timeline, finalized)
+    expected = ".parquet" if ex.pa is not None else ".npz"
+    assert all(path.endswith(expected) for path in paths.values())
+
+
+def test_missing_dependencies_raise_import_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(ex, "pa", None)
+    monkeypatch.setattr(ex, "pq", None)
+    monkeypatch.setattr(ex, "np", None)
+    for fmt in ("auto", "parquet", "arrow", "npz"):
+        with pytest.raises(ImportError, match="pip install"):
+            ex.export_timeline(str(tmp_path / "t"), Timeline(), fmt)
+    with pytest.raises(ImportError, match="pyarrow.*numpy"):
+        ex.available_format()
+
+
+@pytest.mark.parametrize("fmt, missing", [("parquet", "pa"), ("arrow", "pa"), ("npz", "np")])
+def test_missing_backend_of_requested_format(tmp_path, monkeypatch, fmt, missing):
+    monkeypatch.setattr(ex, missing, None)
+    if missing == "pa":
+        monkeypatch.setattr(ex, "pq", None)
+    package = "pyarrow" if missing == "pa" else "numpy"
+    with pytest.raises(ImportError, match=package):
+        ex.export_process_metrics(str(tmp_path / f"p.{fmt}"), [], fmt)
+
+
+def test_missing_backend_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.setattr(ex, "pa", None)
+    monkeypatch.setattr(ex, "pq", None)
+    monkeypatch.setattr(ex, "np", None)
+    timeline, finalized = finished_processes()
+    with pytest.raises(ImportError):
+        ex.export_results(str(tmp_path / "fcfs"), timeline, finalized)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_auto_format_prefers_pyarrow(monkeypatch):
+    backend = object()  # Solo importa que el módulo esté presente
+    monkeypatch.setattr(ex, "pa", backend)
+    monkeypatch.setattr(ex, "np", backend)
+    assert ex.available_format() == "parquet"
+    monkeypatch.setattr(ex, "pa", None)
+    assert ex.available_format() == "npz"
+
+
+def test_invalid_arguments(tmp_path, monkeypatch):
+    with pytest.raises(ValueError, match="csv"):
+        ex.export_timeline(str(tmp_path / "t"), Timeline(), "csv")
+    monkeypatch.setattr(ex, "np", object())  # chunk_size se valida antes de usar el backend
+    with pytest.raises(ValueError, match="chunk_size"):
+        ex.export_timeline(str(tmp_path / "t.npz"), Timeline(), "npz", chunk_size=0)
@@ -0,0 +1,133 @@
+import random
+import pytest
+from models.process import Process
+from core.scheduler import deep_reset
+from core.incremental import CheckpointedSimulation
+from core.algorithms.fcfs import FCFS
+from core.algorithms.sjf import SJFNonPreemptive
+from core.algorithms.round_robin import RoundRobin
+from core.algorithms.srtf import SRTF
+
+SCHEDULERS = [FCFS, SJFNonPreemptive]
+
+
+def workload(n=80, seed=3):
+    # Ráfagas variadas con empates de llegada y huecos idle ocasionales
+    rng = random.Random(seed)
+    t = 0
+    processes = []
+    for i in range(n):
+        t += rng.choice([0, 1, 2, 3, 12])
+        processes.append(Process(f"P{i:02d}", t, rng.randint(1, 6), rng.randint(0, 3)))
+    return processes
+
+
+def snapshot(timeline, processes):
+    slots = [(s.process_id, s.start, s.end) for s in timeline.slots]
+    rows = sorted((p.id, p.arrival_time, p.burst_time, p.start_time, p.completion_time) for p in processes)
+    return slots, rows
+
+
+def assert_matches_scratch(scheduler_cls, result, processes):
+    assert snapshot(*result) == snapshot(*scheduler_cls().run(deep_reset(processes)))
+
+
+def edited(processes, process_id, **changes):
+    out = deep_reset(processes)
+    for p in out:
+        if p.id == process_id:
+            p.arrival_time = changes.get("arrival_time", p.arrival_time)
+            p.burst_time = changes.get("burst_time", p.burst_time)
+    return out
+
+
+@pytest.mark.parametrize("scheduler_cls", SCHEDULERS)
+def test_initial_run_matches_scratch(scheduler_cls):
+    processes = workload()
+    sim = CheckpointedSimulation(scheduler_cls(), processes, interval=4)
+    assert_matches_scratch(scheduler_cls, sim.result(), processes)
+
+
+@pytest.mark.parametrize("scheduler_cls", SCHEDULERS)
+@pytest.mark.parametrize("where", ["antes", "en", "después"])
+def test_burst_edit_relative_to_checkpoint(scheduler_cls, where):
+    processes = workload()
+    sim = CheckpointedSimulation(scheduler_cls(), processes, interval=4)
+    times = sim.checkpoint_times
+    target = times[len(times) // 2]
+    arrivals = sorted({p.arrival_time for p in processes})
+    if where == "antes":
+        arrival = max(a for a in arrivals if a < target)
+    elif where == "en":
+        arrival = target if target in arrivals else min(a for a in arrivals if a > target)
+    else:
+        arrival = min(a for a in arrivals if a > target)
+    victim = next(p for p in processes if p.arrival_time == arrival)
+
+    result = sim.update(victim.id, burst_time=victim.burst_time + 7)
+    assert sim.resumed_from < arrival  # Retoma desde un checkpoint previo, no desde t=0
+    assert_matches_scratch(scheduler_cls, result, edited(processes, victim.id, burst_time=victim.burst_time + 7))
+
+
+@pytest.mark.parametrize("scheduler_cls", SCHEDULERS)
+@pytest.mark.parametrize("delta", [-9, 5, 40])
+def test_arrival_edit(scheduler_cls, delta):
+    processes = workload()
+    sim = CheckpointedSimulation(scheduler_cls(), processes, interval=4)
+    victim = processes[50]
+    new_arrival = max(0, victim.arrival_time + delta)
+    result = sim.update(victim.id, arrival_time=new_arrival)
+    assert sim.resumed_from <= min(victim.arrival_time, new_arrival)
+    assert_matches_scratch(scheduler_cls, result, edited(processes, victim.id, arrival_time=new_arrival))
+
+
+@pytest.mark.parametrize("scheduler_cls", SCHEDULERS)
+def test_consecutive_edits_accumulate(scheduler_cls):
+    processes = workload()
+    sim = CheckpointedSimulation(scheduler_cls(), processes, interval=3)
+    current = deep_reset(processes)
+    for pid, burst in (("P60", 9), ("P10", 1), ("P60", 2), ("P35", 12)):
+        result = sim.update(pid, burst_time=burst)
+        current = edited(current, pid, burst_time=burst)
+        assert_matches_scratch(scheduler_cls, result, current)
+
+
+@pytest.mark.parametrize("scheduler_cls", SCHEDULERS)
+@pytest.mark.parametrize("index", [0, 40, 79])
+def test_remove(scheduler_cls, index):
+    processes = workload()
+    sim = CheckpointedSimulation(scheduler_cls(), processes, interval=4)
+    result = sim.remove(processes[index].id)
+    remaining = [p for i, p in enumerate(processes) if i != index]
+    assert_matches_scratch(scheduler_cls, result, remaining)
+    with pytest.raises(KeyError):
+        sim.remove(processes[index].id)
+
+
+@pytest.mark.parametrize("scheduler_cls", SCHEDULERS)
+@pytest.mark.parametrize("arrival", [0, 55, 10_000])
+def test_insert(scheduler_cls, arrival):
+    processes = workload()
+    sim = CheckpointedSimulation(scheduler_cls(), processes, interval=4)
+    extra = Process("NUEVO", arrival, 4)
+    result = sim.insert(extra)
+    assert_matches_scratch(scheduler_cls, result, processes + [extra])
+    assert extra.start_time is None  # Se simula una copia: el proceso recibido no se modifica
+    with pytest.raises(ValueError):
+        sim.insert(Process("NUEVO", 3, 1))
+
+
+@pytest.mark.parametrize("scheduler", [RoundRobin(2), SRTF()], ids=lambda s: s.name)
+def test_unsupported_scheduler_is_rejected(scheduler):
+    with pytest.raises(ValueError, match="FCFS y SJF"):
+        CheckpointedSimulation(scheduler, workload())
+
+
+def test_invalid_edits_are_rejected():
+    sim = CheckpointedSimulation(FCFS(), workload())
+    with pytest.raises(KeyError):
+        sim.update("X", burst_time=3)
+    with pytest.raises(ValueError):
+        sim.update("P01", burst_time=0)
+    with pytest.raises(ValueError):
+        CheckpointedSimulation(FCFS(), workload(), interval=0)
@@ -0,0 +1,28 @@
+import pytest
+from models.process import Process
+from core.realtime import expand_periodic
+from core.algorithms.edf import EDF
+from core.algorithms.rate_monotonic import RateMonotonic
+
+
+@pytest.mark.parametrize("scheduler", [EDF(max_jobs=10), RateMonotonic(max_jobs=10)])
+def test_aperiodic_processes_do_not_count_toward_max_jobs(scheduler):
+    processes = Process.from_columns([f"P{i}" for i in range(50)], list(range(50)), [1] * 50)
+    _, finalized = scheduler.run(processes)
+    assert len(finalized) == 50
+    assert all(p.completion_time == p.arrival_time + 1 for p in finalized)
+
+
+def test_only_periodic_releases_count_toward_max_jobs():
+    processes = [Process("A", 0, 1), Process("B", 0, 1), Process("T", 0, 1, period=4)]
+    assert len(expand_periodic(processes, horizon=12, max_jobs=3)) == 5
+    with pytest.raises(ValueError, match="t=16 generaría 4 trabajos"):
+        expand_periodic(processes, horizon=16, max_jobs=3)
+
+
+def test_task_arriving_after_horizon_is_rejected():
+    with pytest.raises(ValueError, match="T"):
+        expand_periodic([Process("T", 10, 1, period=4)], horizon=5)
+    with pytest.raises(ValueError, match="horizonte"):
+        EDF(horizon=5).run([Process("A", 0, 1), Process("T", 5, 1, period=4)])
+    assert [p.id for p in expand_periodic([Process("T", 4, 1, period=4)], horizon=5)] == ["T#0"]
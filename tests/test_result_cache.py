@@ -0,0 +1,57 @@
+import inspect
+import os
+from models.process import Process
+from core.timeline import Timeline
+from core.algorithms.edf import EDF
+from core.algorithms.fcfs import FCFS
+from core.algorithms.lottery import LotteryScheduler
+from utils.result_cache import ResultCache, project_modules, scheduler_fingerprint
+
+PROCESSES = [Process("P1", 0, 3), Process("P2", 1, 2)]
+
+
+def module_names(cls):
+    return {m.__name__ for m in project_modules(inspect.getmodule(cls))}
+
+
+def test_code_version_covers_project_dependencies():
+    assert {"core.realtime", "core.timeline", "models.process"} <= module_names(EDF)
+    assert "core.proportional" in module_names(LotteryScheduler)
+    assert not any(name.startswith(("colorama", "json", "typing")) for name in module_names(EDF))
+
+
+def test_fingerprint_changes_with_dependency_source(monkeypatch):
+    before = scheduler_fingerprint(EDF())
+    original = inspect.getsource
+
+    def patched(obj):
+        source = original(obj)
+        return source + "\n# cambio" if getattr(obj, "__name__", None) == "core.realtime" else source
+
+    monkeypatch.setattr(inspect, "getsource", patched)
+    assert scheduler_fingerprint(EDF()) != before
+    assert scheduler_fingerprint(FCFS()) == scheduler_fingerprint(FCFS())
+
+
+def test_unseeded_lottery_is_not_cached(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    assert cache.key_for(PROCESSES, LotteryScheduler(seed=None)) is None
+    assert cache.key_for(PROCESSES, LotteryScheduler(seed=7)) is not None
+
+
+def test_get_survives_concurrent_eviction(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    key = cache.key_for(PROCESSES, FCFS())
+    timeline = Timeline()
+    timeline.add_slot("P1", 0, 3)
+    cache.put(key, timeline, [], {"avg_waiting": 1.0})
+
+    def evicted(path, *args, **kwargs):
+        os.remove(path)  # Otro proceso borra la entrada entre la lectura y el utime
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, "utime", evicted)
+    hit = cache.get(key)
+    assert hit is not None and hit[2] == {"avg_waiting": 1.0}
+    monkeypatch.undo()
+    assert cache.get(key) is None
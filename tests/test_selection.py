@@ -0,0 +1,70 @@
+import random
+import pytest
+from models.process import Process
+from core.scheduler import deep_reset
+from core.selection import predict_best_algorithm, sample_workload
+from core.algorithms.fcfs import FCFS
+from core.algorithms.sjf import SJFNonPreemptive
+from core.algorithms.round_robin import RoundRobin
+from metrics.metrics import compute_system_metrics
+
+
+def workload(n, load, seed=1):
+    # Llegadas de Poisson con ráfagas de media 5: `load` > 1 => un único período ocupado
+    rng = random.Random(seed)
+    t = 0.0
+    processes = []
+    for i in range(n):
+        t += rng.expovariate(load / 5)
+        processes.append(Process(f"P{i}", int(t), rng.randint(1, 9), rng.randint(0, 4)))
+    return processes
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_estimate_on_saturated_trace_includes_backlog(seed):
+    # Con un único período ocupado la espera crece a lo largo de toda la traza
+    processes = workload(3000, 1.5, seed)
+    report = predict_best_algorithm(processes, [FCFS(), SJFNonPreemptive()], sample_size=600, top_k=2)
+    timeline, finalized = FCFS().run(deep_reset(processes))
+    actual = compute_system_metrics(finalized, timeline)["avg_waiting"]
+    assert report.estimates["FCFS"]["avg_waiting"] == pytest.approx(actual, rel=0.1)
+    assert report.best == "SJF (no apropiativo)"
+
+
+def test_report_counts_processes_actually_simulated():
+    processes = workload(3000, 1.5)
+    report = predict_best_algorithm(processes, [FCFS()], sample_size=600, top_k=1)
+    assert report.sample_size == 600
+    assert report.simulated > report.sample_size  # Calentamiento y backlog heredado
+
+    small = predict_best_algorithm(processes[:100], [FCFS()], sample_size=600, top_k=1)
+    assert small.sample_size == small.simulated == 100
+    assert small.errors["FCFS"] == 0
+
+
+def test_windows_spread_over_saturated_trace():
+    processes = workload(3000, 1.5)
+    samples = sample_workload(processes, 600, random.Random(0), windows=4)
+    assert len(samples) == 4
+    # Salvo quizá la primera, las ventanas arrancan con trabajo heredado en cola
+    assert all(window.warmup > 0 for window in samples[1:])
+    assert sum(window.measured for window in samples) == 600
+
+
+@pytest.mark.parametrize("sample_size", [0, -5])
+def test_non_positive_sample_size_is_rejected(sample_size):
+    with pytest.raises(ValueError, match="sample_size"):
+        predict_best_algorithm(workload(100, 0.7), [FCFS()], sample_size=sample_size)
+    with pytest.raises(ValueError):
+        sample_workload(workload(100, 0.7), sample_size, random.Random(0))
+
+
+def test_schedulers_with_same_name_are_kept_apart():
+    processes = workload(3000, 0.9)
+    schedulers = [RoundRobin(1), RoundRobin(8), RoundRobin(8)]
+    report = predict_best_algorithm(processes, schedulers, sample_size=600, top_k=3)
+    labels = ["Round Robin (quantum=1)", "Round Robin (quantum=8) #1", "Round Robin (quantum=8) #2"]
+    assert sorted(report.estimates) == sorted(labels)
+    assert sorted(report.candidates) == sorted(labels)
+    assert report.estimates[labels[0]] != report.estimates[labels[1]]
+    assert report.actual[labels[1]] == report.actual[labels[2]]
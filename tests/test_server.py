@@ -0,0 +1,125 @@
+import asyncio
+import http.client
+import json
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import pytest
+from service.server import SimulationServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    # Servidor real en loopback (puerto libre) atendido por un event loop en otro hilo
+    srv = SimulationServer(port=0, workers=2, job_timeout=2.0)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(srv.start())
+        started.set()
+        try:
+            loop.run_until_complete(srv.serve_forever())
+        except asyncio.CancelledError:
+            pass
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert started.wait(30)
+    yield srv
+    loop.call_soon_threadsafe(lambda: [task.cancel() for task in asyncio.all_tasks(loop)])
+    thread.join(30)
+
+
+def request(srv, method, path, payload=None):
+    conn = http.client.HTTPConnection("127.0.0.1", srv.port, timeout=60)
+    body = None if payload is None else json.dumps(payload)
+    conn.request(method, path, body=body)
+    response = conn.getresponse()
+    data = response.read().decode("utf-8")
+    conn.close()
+    return response.status, data
+
+
+def simulate(srv, processes, algorithms):
+    status, data = request(srv, "POST", "/simulate", {"processes": processes, "algorithms": algorithms})
+    lines = [json.loads(line) for line in data.splitlines() if line] if status == 200 else data
+    return status, lines
+
+
+ROWS = [{"id": "P1", "arrival": 0, "burst": 3}, {"id": "P2", "arrival": 1, "burst": 2, "priority": 1}]
+
+
+def test_simulate_streams_results(server):
+    status, lines = simulate(server, ROWS, [{"name": "fcfs"}, {"name": "rr", "quantum": 1}])
+    assert status == 200
+    assert {line["type"] for line in lines} == {"slot", "metrics", "done"}
+    assert lines[-1]["type"] == "done" and lines[-1]["best"] is not None
+    fcfs = [(l["process_id"], l["start"], l["end"]) for l in lines
+            if l["type"] == "slot" and l["algorithm"] == "FCFS"]
+    assert fcfs == [("P1", 0, 3), ("P2", 3, 5)]
+
+
+@pytest.mark.parametrize("row", [
+    {"id": "A", "arrival": 0, "burst": 0},
+    {"id": "A", "arrival": -1, "burst": 2},
+    {"id": "A", "arrival": 0, "burst": 2, "period": 0},
+])
+def test_invalid_workload_is_rejected(server, row):
+    status, _ = simulate(server, [row], [{"name": "srtf"}])
+    assert status == 400
+    assert json.loads(request(server, "GET", "/health")[1])["pending"] == 0
+
+
+@pytest.mark.parametrize("payload", [
+    {"processes": ROWS, "algorithms": ["fcfs"]},
+    {"processes": ROWS, "algorithms": {"name": "fcfs"}},
+    [ROWS],
+])
+def test_malformed_request_is_rejected(server, payload):
+    status, _ = request(server, "POST", "/simulate", payload)
+    assert status == 400
+
+
+def test_job_timeout_frees_the_service(server):
+    # SRTF avanza de a una unidad: una ráfaga enorme excede el límite de tiempo
+    status, lines = simulate(server, [{"id": "L", "arrival": 0, "burst": 50_000_000}],
+                             [{"name": "srtf"}, {"name": "fcfs"}])
+    assert status == 200
+    errors = [line["error"] for line in lines if line["type"] == "error"]
+    assert len(errors) == 1 and "límite" in errors[0]
+    assert lines[-1]["best"] == "FCFS"
+    assert json.loads(request(server, "GET", "/health")[1])["pending"] == 0
+    status, lines = simulate(server, ROWS, [{"name": "srtf"}])
+    assert status == 200 and lines[-1]["best"] is not None
+
+
+def test_timeout_does_not_disturb_concurrent_requests(server):
+    results = {}
+
+    def slow():
+        results["slow"] = simulate(server, [{"id": "L", "arrival": 0, "burst": 50_000_000}],
+                                   [{"name": "srtf"}])
+
+    thread = threading.Thread(target=slow)
+    thread.start()
+    time.sleep(1.5)
+    # Esta simulación (~0.7 s) está en curso cuando la otra excede el límite
+    status, lines = simulate(server, [{"id": "M", "arrival": 0, "burst": 600_000}], [{"name": "srtf"}])
+    thread.join(60)
+    assert status == 200
+    assert not [line for line in lines if line["type"] == "error"]
+    assert lines[-1]["best"] is not None
+    status, lines = results["slow"]
+    assert status == 200 and "límite" in lines[0]["error"]
+
+
+def test_service_recovers_when_workers_die(server):
+    simulate(server, ROWS, [{"name": "fcfs"}])  # Asegura que los workers existan
+    for child in multiprocessing.active_children():
+        os.kill(child.pid, signal.SIGKILL)
+    status, lines = simulate(server, ROWS, [{"name": "fcfs"}])
+    assert status == 200 and lines[-1]["best"] is not None